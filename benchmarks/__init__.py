@@ -0,0 +1,9 @@
+import os
+
+
+def use_dummy_drivers():
+    """
+     Points SDL at the dummy video and audio drivers so benchmarks run without a window or sound card.
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
@@ -0,0 +1,63 @@
+import random
+from time import perf_counter
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+import pygame
+from engine_support import AudioManager, asset_manifest, laser_sound, sound_explosion
+
+FRAMES = 600
+DT = 1 / 60
+SHOTS_PER_FRAME = 1
+HITS_PER_FRAME = (0, 6)
+
+
+def combat(seed=0):
+    """
+     Events of a swipe at cooldown 0: a shot every frame and a burst of meteor hits most frames.
+    """
+    rng = random.Random(seed)
+    return [(SHOTS_PER_FRAME, rng.randint(*HITS_PER_FRAME)) for _ in range(FRAMES)]
+
+
+def run(frames, play, flush):
+    busy_peak = 0
+    spent = 0.0
+    for shots, hits in frames:
+        started = perf_counter()
+        for _ in range(shots):
+            play('laser')
+        for _ in range(hits):
+            play('explosion')
+        flush()
+        spent += perf_counter() - started
+        busy_peak = max(busy_peak, sum(pygame.mixer.Channel(i).get_busy() for i in range(pygame.mixer.get_num_channels())))
+        pygame.time.wait(int(DT * 1000))
+    return spent * 1000 / FRAMES, busy_peak
+
+
+def main():
+    pygame.mixer.init()
+    pygame.init()
+    pygame.mixer.set_num_channels(16)
+    frames = combat()
+
+    sounds = {name: pygame.mixer.Sound(asset_manifest.resolve(path))
+              for name, path in (('laser', laser_sound), ('explosion', sound_explosion))}
+    naive_ms, naive_peak = run(frames, lambda name: sounds[name].play(), lambda: None)
+    pygame.mixer.stop()
+
+    audio = AudioManager(channels=16)
+    audio.register('laser', laser_sound, volume=0.2, voices=3, priority=0)
+    audio.register('explosion', sound_explosion, volume=0.2, voices=4, priority=1)
+    managed_ms, managed_peak = run(frames, audio.play, audio.flush)
+
+    print(f"{'mode':>8} {'ms/frame':>9} {'peak voices':>12}")
+    print(f"{'direct':>8} {naive_ms:>9.3f} {naive_peak:>12}")
+    print(f"{'manager':>8} {managed_ms:>9.3f} {managed_peak:>12}")
+    print(audio.stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+from time import perf_counter
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+import pygame
+from engine_support import WINDOW_WIDTH, WINDOW_HEIGHT, Background, strip_cache, asset_manifest
+from levels.main import BACKGROUND_IMAGE, BG_COLOR
+
+FRAMES = 600
+DT_MS = 1000 / 60
+
+
+def timed(draw, surface):
+    start = perf_counter()
+    for frame in range(FRAMES):
+        draw(surface, frame * DT_MS)
+    return (perf_counter() - start) * 1000 / FRAMES
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    image = pygame.image.load(asset_manifest.resolve(BACKGROUND_IMAGE))
+    alpha_image = image.convert_alpha()
+
+    def alpha_composite(target, time_ms):
+        target.fill(BG_COLOR)
+        target.blit(alpha_image, (0, 0))
+
+    start = perf_counter()
+    backdrop = Background((WINDOW_WIDTH, WINDOW_HEIGHT), BG_COLOR)
+    backdrop.set_image(image)
+    built = (perf_counter() - start) * 1000
+    start = perf_counter()
+    Background((WINDOW_WIDTH, WINDOW_HEIGHT), BG_COLOR).set_image(image)
+    rebuilt = (perf_counter() - start) * 1000
+
+    still = Background((WINDOW_WIDTH, WINDOW_HEIGHT), BG_COLOR, layers=())
+    still.set_image(image)
+
+    print(f'display {surface.get_bitsize()} bit, source {image.get_size()}, {len(strip_cache)} cached strips')
+    print(f'set_image: {built:.1f} ms first, {rebuilt:.1f} ms with cached strips')
+    print(f"{'path':>34} {'ms/frame':>9}")
+    print(f"{'fill + alpha blit (before)':>34} {timed(alpha_composite, surface):>9.3f}")
+    print(f"{'opaque base':>34} {timed(still.draw, surface):>9.3f}")
+    print(f"{'opaque base + 2 scrolling layers':>34} {timed(backdrop.draw, surface):>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
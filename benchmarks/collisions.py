@@ -0,0 +1,66 @@
+import random
+from time import perf_counter
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+import pygame
+from engine_support import WINDOW_WIDTH, WINDOW_HEIGHT, SpatialHash
+
+METEOR_COUNTS = (30, 100, 300, 1000)
+LASER_COUNTS = (10, 50, 200)
+ROUNDS = 20
+
+
+def scatter(group, count, size, image, mask):
+    for _ in range(count):
+        sprite = pygame.sprite.Sprite(group)
+        sprite.image = image
+        sprite.mask = mask
+        sprite.rect = image.get_rect(center=(random.randint(0, WINDOW_WIDTH), random.randint(0, WINDOW_HEIGHT)))
+
+
+def run_group_scan(meteors, lasers):
+    start = perf_counter()
+    for _ in range(ROUNDS):
+        for laser in lasers:
+            pygame.sprite.spritecollide(laser, meteors, False, pygame.sprite.collide_mask)
+    return (perf_counter() - start) / ROUNDS * 1000
+
+
+def run_broadphase(broadphase, meteors, lasers):
+    start = perf_counter()
+    for _ in range(ROUNDS):
+        broadphase.build(meteors)
+        for laser in lasers:
+            broadphase.spritecollide(laser, False, pygame.sprite.collide_mask)
+    return (perf_counter() - start) / ROUNDS * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    random.seed(0)
+
+    meteor_image = pygame.Surface((100, 100), pygame.SRCALPHA)
+    pygame.draw.circle(meteor_image, 'white', (50, 50), 45)
+    laser_image = pygame.Surface((200, 200), pygame.SRCALPHA)
+    pygame.draw.line(laser_image, 'white', (40, 160), (160, 40), 12)
+    meteor_mask = pygame.mask.from_surface(meteor_image)
+    laser_mask = pygame.mask.from_surface(laser_image)
+
+    print(f"{'meteors':>8} {'lasers':>7} {'scan ms':>9} {'grid ms':>8} {'speedup':>8}")
+    for meteor_count in METEOR_COUNTS:
+        for laser_count in LASER_COUNTS:
+            meteors = pygame.sprite.Group()
+            lasers = pygame.sprite.Group()
+            scatter(meteors, meteor_count, 100, meteor_image, meteor_mask)
+            scatter(lasers, laser_count, 200, laser_image, laser_mask)
+
+            brute = run_group_scan(meteors, lasers)
+            grid = run_broadphase(SpatialHash(WINDOW_WIDTH, WINDOW_HEIGHT, 128), meteors, lasers)
+            print(f"{meteor_count:>8} {laser_count:>7} {brute:>9.3f} {grid:>8.3f} {brute / grid:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+from time import perf_counter
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+from engine_support import RandomInput, WINDOW_WIDTH, WINDOW_HEIGHT
+from levels.main import Game, FULL_RENDER, DIRTY_RENDER
+
+FRAMES = 1500
+SEED = 7
+
+
+def run(render_mode):
+    game = Game(headless=True, controls=RandomInput(SEED), seed=SEED, render_mode=render_mode)
+    pixels = 0
+    frames = 0
+    start = perf_counter()
+    while frames < FRAMES and game.simulate(1, render=True):
+        pixels += game.pixels_pushed
+        frames += 1
+        if game.health.width <= 0:
+            game.reset_game()
+    elapsed = perf_counter() - start
+    return pixels / frames, elapsed / frames * 1000
+
+
+def main():
+    screen = WINDOW_WIDTH * WINDOW_HEIGHT
+    print(f"{'mode':>6} {'pixels/frame':>13} {'% screen':>9} {'MB/frame':>9} {'ms/frame':>9}")
+    for render_mode in (FULL_RENDER, DIRTY_RENDER):
+        pixels, ms = run(render_mode)
+        print(f"{render_mode:>6} {pixels:>13.0f} {pixels / screen * 100:>8.1f}% {pixels * 4 / 1e6:>9.2f} {ms:>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
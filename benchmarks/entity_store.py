@@ -0,0 +1,76 @@
+import random
+from time import perf_counter
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+import pygame
+from engine_support import WINDOW_WIDTH, WINDOW_HEIGHT, entity_store
+from game_elements import Meteor
+
+COUNTS = (100, 1000, 10000)
+FRAMES = 60
+DT = 1 / 60
+
+
+class SpriteMeteor(pygame.sprite.Sprite):
+    """
+     The previous Meteor update: per-instance Vector2 motion, animation and culling.
+    """
+    def __init__(self, group, frames, masks):
+        super().__init__(group)
+        self.meteor_frames = frames
+        self.meteor_masks = masks
+        self.image = frames[0]
+        self.rect = self.image.get_rect(center=(random.randint(0, WINDOW_WIDTH), random.randint(0, WINDOW_HEIGHT)))
+        self.frame_index = 0
+        self.animation_speed = 0.27
+        self.velocity = pygame.Vector2(random.uniform(-150, 150), random.uniform(150, 300))
+
+    def update(self, dt):
+        self.frame_index += self.animation_speed
+        if self.frame_index >= len(self.meteor_frames):
+            self.frame_index = 0
+        self.image = self.meteor_frames[int(self.frame_index)]
+        self.mask = self.meteor_masks[int(self.frame_index)]
+        self.rect.center += self.velocity * dt
+        if self.rect.top > WINDOW_HEIGHT:
+            self.rect.bottom = 0
+
+
+def run_sprites(count, store):
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        SpriteMeteor(group, store.frames, store.masks)
+    start = perf_counter()
+    for _ in range(FRAMES):
+        group.update(DT)
+    return (perf_counter() - start) / FRAMES * 1000
+
+
+def run_store(count, store):
+    meteors = pygame.sprite.Group()
+    for _ in range(count):
+        Meteor(meteors, meteors, store)
+    start = perf_counter()
+    for _ in range(FRAMES):
+        store.step(DT)
+        store.sync()
+    return (perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    random.seed(0)
+    backend = 'numpy' if entity_store.load_numpy() else 'array'
+
+    print(f"{'meteors':>8} {'sprites ms':>11} {backend + ' ms':>10} {'speedup':>8}")
+    for count in COUNTS:
+        sprites = run_sprites(count, Meteor.create_store(count))
+        store = run_store(count, Meteor.create_store(count))
+        print(f"{count:>8} {sprites:>11.3f} {store:>10.3f} {sprites / store:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+import random
+from os.path import join
+from time import perf_counter
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+import pygame
+from engine_support import WINDOW_WIDTH, WINDOW_HEIGHT, SimulationClock, asset_cache, asset_manifest, \
+    png_image_cutter, image_transformer
+from game_elements import AnimatedExplosion, explosion_effects, EXPLOSION_SHEET, EXPLOSION_FRAME, EXPLOSION_SIZE
+
+COUNTS = (1, 8, 32, 128, 512)
+FRAMES = 240
+
+
+class LegacyExplosion(AnimatedExplosion):
+    """
+     The old per-frame update, which built a new rect for every frame of every explosion.
+    """
+    animation_speed = 0.5
+
+    def spawn(self, pos, groups, clock):
+        super().spawn(pos, groups, clock)
+        self.frame_index = 0
+
+    def update(self, dt):
+        self.frame_index += self.animation_speed
+        if self.frame_index >= len(self.frames):
+            self.kill()
+        else:
+            self.image = self.frames[int(self.frame_index)]
+            self.rect = self.image.get_rect(center=self.rect.center)
+
+
+def first_explosion_ms():
+    """
+     What the first hit of a session used to cost: slicing sheet 1 from disk and scaling every frame.
+    """
+    start = perf_counter()
+    frames = png_image_cutter(asset_manifest.resolve(join(*EXPLOSION_SHEET)), *EXPLOSION_FRAME)
+    [image_transformer(frame, *EXPLOSION_SIZE) for frame in frames]
+    return (perf_counter() - start) * 1000
+
+
+def run(explosion_class, count, surface):
+    rng = random.Random(count)
+    clock = SimulationClock()
+    group = pygame.sprite.LayeredUpdates()
+    explosions = []
+    for _ in range(count):
+        explosion = explosion_class((rng.randint(0, WINDOW_WIDTH), rng.randint(0, WINDOW_HEIGHT)), group, clock)
+        explosion.frame_index = rng.randrange(len(explosion.frames))
+        explosion.animation.started -= explosion.frame_index / explosion.animation.fps * 1000
+        explosions.append(explosion)
+
+    rects = 0
+    updating = drawing = 0.0
+    for _ in range(FRAMES):
+        before = [explosion.rect for explosion in explosions]
+        clock.advance(1 / 60)
+        start = perf_counter()
+        group.update(1 / 60)
+        updating += perf_counter() - start
+        rects += sum(explosion.rect is not rect for explosion, rect in zip(explosions, before))
+        for explosion in explosions:
+            if not explosion.alive():
+                explosion.spawn(explosion.rect.center, group, clock)
+        start = perf_counter()
+        group.draw(surface)
+        drawing += perf_counter() - start
+    return updating * 1e6 / FRAMES / count, drawing * 1000 / FRAMES, rects / FRAMES
+
+
+def main():
+    pygame.init()
+    surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    cold = first_explosion_ms()
+    if asset_cache.atlas.available:
+        asset_cache.atlas.set_pages(asset_cache.atlas.decode())
+    start = perf_counter()
+    explosion_effects.load()
+    loaded = (perf_counter() - start) * 1000
+    start = perf_counter()
+    explosion_effects.variant()
+    warm = (perf_counter() - start) * 1000
+    print(f'first explosion, sliced on demand: {cold:.1f} ms')
+    print(f'all {len(explosion_effects.variants)} variants at load: {loaded:.1f} ms '
+          f'({"sliced from the atlas" if asset_cache.atlas.available else "from the source sheets"}), '
+          f'first explosion after: {warm:.3f} ms')
+
+    print(f"{'explosions':>10} {'old update us/each':>19} {'new update us/each':>19} {'draw ms/frame':>14} "
+          f"{'old rects/frame':>16} {'new rects/frame':>16}")
+    for count in COUNTS:
+        old_update, _, old_rects = run(LegacyExplosion, count, surface)
+        new_update, draw, new_rects = run(AnimatedExplosion, count, surface)
+        print(f'{count:>10} {old_update:>19.2f} {new_update:>19.2f} {draw:>14.3f} {old_rects:>16.1f} {new_rects:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+import os
+import random
+import tempfile
+from statistics import median
+from time import perf_counter
+
+from high_score_resources import HighScoresManager
+
+RECORDS = 100_000
+PLAYERS = 500
+DAYS = 60
+QUERIES = 200
+
+
+def timed(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        samples.append((perf_counter() - start) * 1000)
+    samples.sort()
+    return median(samples), samples[int(len(samples) * 0.99)]
+
+
+def main():
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as directory:
+        manager = HighScoresManager(os.path.join(directory, 'scores.db'), legacy_filename=None)
+        names = [f'player{i}' for i in range(PLAYERS)]
+        base = 1_700_000_000
+
+        start = perf_counter()
+        add_samples = []
+        for i in range(RECORDS):
+            call = perf_counter()
+            manager.store.add(random.choice(names), random.randint(0, 500), base + random.randrange(DAYS) * 86400)
+            add_samples.append((perf_counter() - call) * 1000)
+        queued = perf_counter() - start
+        manager.store.flush()
+        committed = perf_counter() - start
+        add_samples.sort()
+
+        print(f'{RECORDS} inserts: queued in {queued:.2f}s, committed in {committed:.2f}s '
+              f'({RECORDS / committed:,.0f} rows/s)')
+        print(f'add() on the game thread: p50 {median(add_samples) * 1000:.1f} us, '
+              f'p99 {add_samples[int(RECORDS * 0.99)] * 1000:.1f} us')
+        print(f'single add_high_score: {timed(lambda: manager.add_high_score("bench", 42), 100)[0] * 1000:.1f} us p50')
+
+        day = manager.get_high_scores(1)[0]['day']
+        for label, query in (('top 10', lambda: manager.store.top(10)),
+                             ('top 10 by player', lambda: manager.store.top(10, name=random.choice(names))),
+                             ('top 10 by day', lambda: manager.store.top(10, day=day)),
+                             ('page 50 of top', lambda: manager.store.top(10, offset=500))):
+            p50, p99 = timed(query, QUERIES)
+            print(f'{label:<17} p50 {p50:.3f} ms  p99 {p99:.3f} ms')
+
+        manager.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+import time
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+import pygame
+from levels.main import Game
+
+SECONDS = 3
+
+
+def busy_menu(game, seconds):
+    """
+     The previous main-menu loop: redraw and flip as fast as possible while polling events.
+    """
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        game.menu.display_menu()
+        pygame.display.flip()
+        pygame.event.get()
+
+
+def idle_menu(game, seconds):
+    pygame.time.set_timer(pygame.QUIT, seconds * 1000, loops=1)
+    game.game_run()
+
+
+def measure(run, game):
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    run(game, SECONDS)
+    return (time.process_time() - cpu) / (time.perf_counter() - wall) * 100
+
+
+def main():
+    game = Game()
+    busy = measure(busy_menu, game)
+    idle = measure(idle_menu, game)
+    print(f'main menu CPU over {SECONDS}s: busy loop {busy:.1f}%, event-driven {idle:.1f}%')
+
+
+if __name__ == '__main__':
+    main()
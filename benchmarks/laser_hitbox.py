@@ -0,0 +1,83 @@
+import random
+from time import perf_counter
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+import pygame
+from engine_support import WINDOW_WIDTH, WINDOW_HEIGHT, LASER_WIDTH, LASER_HEIGHT, METEOR_WIDTH, METEOR_HEIGHT, \
+    asset_cache, collide_hitbox
+from game_elements import LASER_IMAGE, LASER_ANGLE, METEOR_FOLDER, METEOR_SIZE
+
+PAIRS = 20000
+ROUNDS = 5
+
+
+class Body(pygame.sprite.Sprite):
+    def __init__(self, image, mask, center, hit_shape=None):
+        super().__init__()
+        self.image = image
+        self.mask = mask
+        self.rect = image.get_rect(center=center)
+        self.hit_shape = hit_shape
+        self.hitbox = hit_shape.rect(self.rect) if hit_shape is not None else None
+
+
+def make_pairs(laser_frames, meteor_frames):
+    """
+     Laser/meteor pairs whose full rects overlap, the ones that reach the mask test in the broadphase.
+    """
+    pairs = []
+    reach = (LASER_WIDTH + METEOR_WIDTH) // 2, (LASER_HEIGHT + METEOR_HEIGHT) // 2
+    while len(pairs) < PAIRS:
+        x, y = random.randint(200, WINDOW_WIDTH - 200), random.randint(200, WINDOW_HEIGHT - 200)
+        laser = Body(laser_frames.images[0], laser_frames.masks[0], (x, y), laser_frames.hit_shape(0))
+        frame = random.randrange(len(meteor_frames))
+        meteor = Body(meteor_frames.images[frame], meteor_frames.masks[frame],
+                      (x + random.randint(-reach[0], reach[0]), y + random.randint(-reach[1], reach[1])))
+        if laser.rect.colliderect(meteor.rect):
+            pairs.append((laser, meteor))
+    return pairs
+
+
+def full_mask(laser, meteor):
+    return pygame.sprite.collide_mask(laser, meteor) is not None
+
+
+def tight(laser, meteor):
+    return laser.hitbox.colliderect(meteor.rect) and collide_hitbox(laser, meteor)
+
+
+def timed(test, pairs):
+    best = float('inf')
+    for _ in range(ROUNDS):
+        start = perf_counter()
+        for laser, meteor in pairs:
+            test(laser, meteor)
+        best = min(best, perf_counter() - start)
+    return best / len(pairs) * 1e6
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    random.seed(0)
+
+    laser_frames = asset_cache.image(LASER_IMAGE, (LASER_WIDTH, LASER_HEIGHT), angle=LASER_ANGLE)
+    meteor_frames = asset_cache.folder(METEOR_FOLDER, METEOR_SIZE)
+    shape = laser_frames.hit_shape(0)
+    pairs = make_pairs(laser_frames, meteor_frames)
+
+    hits = [full_mask(*pair) for pair in pairs]
+    mismatches = sum(full_mask(*pair) != tight(*pair) for pair in pairs)
+    rejected = sum(not laser.hitbox.colliderect(meteor.rect) for laser, meteor in pairs)
+    print(f'laser mask {laser_frames.masks[0].get_size()} -> hitbox {shape.size} at {shape.offset}')
+    print(f'{PAIRS} rect-overlapping pairs: {sum(hits)} hits, {rejected} rejected by the hitbox, '
+          f'{mismatches} mismatches')
+    print(f"{'test':>22} {'us/pair':>8}")
+    print(f"{'full mask':>22} {timed(full_mask, pairs):>8.3f}")
+    print(f"{'hitbox + cropped mask':>22} {timed(tight, pairs):>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
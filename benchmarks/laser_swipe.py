@@ -0,0 +1,38 @@
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+from levels.main import Game
+from game_elements import laser_pool, meteor_pool, explosion_pool
+
+FRAMES = 1800
+REPORT_EVERY = 300
+DT = 1 / 60
+
+
+def main():
+    game = Game()
+    game.load_gameplay()
+    game.player.energy.width = game.player.energy.initial_width
+    previous = laser_pool.allocated
+
+    print(f"{'frame':>6} {'allocated':>10} {'reused':>8} {'exhausted':>10} {'active':>7}")
+    for frame in range(1, FRAMES + 1):
+        game.player.can_shoot = True
+        game.player.energy.width = game.player.energy.initial_width
+        game.player.shoot(game.player.groups, game.lasers, game.player)
+        game.game_clock.advance(DT)
+        game.step(DT)
+
+        if frame % REPORT_EVERY == 0:
+            stats = laser_pool.stats()
+            print(f"{frame:>6} {stats['allocated'] - previous:>10} {stats['reused']:>8} "
+                  f"{stats['exhausted']:>10} {stats['active']:>7}")
+            previous = stats['allocated']
+
+    print('meteors', meteor_pool.stats())
+    print('explosions', explosion_pool.stats())
+
+
+if __name__ == '__main__':
+    main()
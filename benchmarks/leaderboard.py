@@ -0,0 +1,81 @@
+import os
+import random
+import tempfile
+from statistics import median
+from time import perf_counter
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+import pygame
+from engine_support import WINDOW_WIDTH, WINDOW_HEIGHT, text_renderer
+from high_score_resources import HighScoresManager
+from ui import LeaderboardView
+
+SIZES = (100, 10_000, 100_000)
+PLAYERS = 500
+FRAMES = 300
+PAGES = 200
+RENDER_ALL_LIMIT = 10_000
+
+
+def timed(function, repeat=1):
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        samples.append((perf_counter() - start) * 1000)
+    return median(samples)
+
+
+def key(view, code):
+    view.handle_key(pygame.event.Event(pygame.KEYDOWN, key=code, unicode=''))
+
+
+def render_all(screen, manager):
+    """
+     The old screen: one font.render per stored entry, drawn down the page.
+    """
+    font = text_renderer.font(40)
+    screen.fill('#adadff')
+    for i, entry in enumerate(manager.get_high_scores(manager.count())):
+        text = font.render(f"{i + 1}. {entry['name']}: {entry['score']}", True, (255, 255, 255))
+        screen.blit(text, text.get_rect(center=(WINDOW_WIDTH // 2, 100 + i * 50)))
+
+
+def measure(screen, directory, size):
+    random.seed(size)
+    manager = HighScoresManager(os.path.join(directory, f'{size}.db'), legacy_filename=None)
+    names = [f'player{i}' for i in range(PLAYERS)]
+    manager.store.add_many((random.choice(names), random.randint(0, 5000)) for _ in range(size))
+
+    view = LeaderboardView(screen)
+    result = {'open ms': timed(lambda: view.open(manager), 20)}
+    view.draw()
+    result['draw ms'] = timed(view.draw, FRAMES)
+    result['scroll ms'] = timed(lambda: (key(view, pygame.K_DOWN), view.draw()), FRAMES)
+    result['page ms'] = timed(lambda: (key(view, pygame.K_PAGEDOWN), view.draw()), PAGES)
+    result['end ms'] = timed(lambda: (key(view, pygame.K_END), view.draw()), 20)
+    result['offset page ms'] = timed(lambda: manager.get_high_scores(10, max(0, size - 10)), 20)
+    result['render all ms'] = timed(lambda: render_all(screen, manager)) if size <= RENDER_ALL_LIMIT else None
+    result['rows cached'] = view.stats()['entries']
+    manager.close()
+    return result
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    with tempfile.TemporaryDirectory() as directory:
+        results = {size: measure(screen, directory, size) for size in SIZES}
+
+    columns = list(results[SIZES[0]])
+    print(f"{'scores':>8} " + ' '.join(f'{column:>14}' for column in columns))
+    for size, result in results.items():
+        cells = ('skipped' if result[column] is None else f'{result[column]:.3f}' if isinstance(result[column], float)
+                 else result[column] for column in columns)
+        print(f'{size:>8} ' + ' '.join(f'{cell:>14}' for cell in cells))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+import pygame
+from engine_support import WINDOW_WIDTH, WINDOW_HEIGHT, SimulationClock, ScriptedInput, RIGHT
+from game_elements import Meteor, Player, AnimatedExplosion, explosion_effects
+from ui import Health, Energy
+
+RATES = (30, 60, 120)
+SECONDS = 1.6
+
+
+class Rock(pygame.sprite.Sprite):
+    def __init__(self):
+        super().__init__()
+        self.rect = pygame.Rect(0, 0, 1, 1)
+
+
+def measure(hz):
+    """
+     Steps one of each animated sprite and both bars at `hz` for SECONDS of game time.
+     The ship starts banking on the first step, so its time is counted from there.
+    """
+    dt = 1 / hz
+    clock = SimulationClock()
+    sprites = pygame.sprite.Group()
+    health = Health(sprites, clock)
+    energy = Energy(sprites, clock)
+    health.width = energy.width = 0
+    player = Player(sprites, pygame.sprite.Group(), health, energy, ScriptedInput([RIGHT]), clock)
+    explosion = AnimatedExplosion((0, 0), sprites, clock)
+    store = Meteor.create_store(1)
+    store.add(Rock(), 0, 0, 0, 0)
+
+    banked = lasted = None
+    frames = 0.0
+    for step in range(1, round(SECONDS * hz) + 1):
+        clock.advance(dt)
+        sprites.update(dt)
+        phase = store.columns['phase'][0]
+        store.step(dt)
+        frames += (store.columns['phase'][0] - phase) % store.frame_count
+        if banked is None and player.image is player.right_frames[-1]:
+            banked = clock.now() - dt * 1000
+        if lasted is None and not explosion.alive():
+            lasted = clock.now()
+
+    return {
+        'energy/s': energy.width / SECONDS,
+        'health/s': health.width / SECONDS,
+        'meteor frames/s': frames / SECONDS,
+        'explosion ms': lasted,
+        'bank ms': banked,
+    }
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    explosion_effects.load()
+
+    results = {hz: measure(hz) for hz in RATES}
+    columns = list(results[RATES[0]])
+    print(f"{'logic hz':>8} " + ' '.join(f'{column:>16}' for column in columns))
+    for hz, result in results.items():
+        print(f'{hz:>8} ' + ' '.join(f'{result[column]:>16.1f}' for column in columns))
+
+    frames = len(explosion_effects.variant())
+    print(f'per-tick rates before: meteors 0.27 frames and explosions 0.5 frames per step, banking one frame per step')
+    print(f"{'logic hz':>8} {'meteor frames/s':>16} {'explosion ms':>16} {'bank ms':>16}")
+    for hz in RATES:
+        print(f'{hz:>8} {0.27 * hz:>16.1f} {frames / 0.5 * 1000 / hz:>16.1f} {3 * 1000 / hz:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
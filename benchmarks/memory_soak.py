@@ -0,0 +1,78 @@
+import argparse
+import gc
+import os
+import resource
+import sys
+import tempfile
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+import pygame
+from engine_support import RandomInput
+from game_elements import meteor_pool, laser_pool, explosion_pool, player_explosion_pool
+from high_score_resources import HighScoresManager
+from levels.main import Game, FIXED_DT
+
+WARMUP_ROUNDS = 10
+MAX_RSS_GROWTH_KB = 4096
+MAX_OBJECT_GROWTH = 0.01
+
+
+def rss_kb():
+    """
+     Current resident set size from /proc, or the peak from getrusage where /proc is missing.
+    """
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * resource.getpagesize() // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def live_objects():
+    """
+     Objects tracked by the garbage collector, and live sprites that are not held by a sprite pool.
+     Pools keep up to their capacity, so their size is reported separately.
+    """
+    gc.collect()
+    objects = gc.get_objects()
+    sprites = sum(isinstance(item, pygame.sprite.Sprite) for item in objects)
+    pooled = sum(pool.allocated for pool in (meteor_pool, laser_pool, explosion_pool, player_explosion_pool))
+    return len(objects), sprites - pooled, pooled
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Play many headless rounds and check that memory stays flat.')
+    parser.add_argument('--rounds', type=int, default=200)
+    parser.add_argument('--frames', type=int, default=1800, help='frame cap per round')
+    args = parser.parse_args()
+
+    directory = tempfile.TemporaryDirectory()
+    game = Game(headless=True, controls=RandomInput(0), seed=0,
+                high_scores=HighScoresManager(os.path.join(directory.name, 'scores.db'), legacy_filename=None))
+    baseline = None
+    print(f"{'round':>6} {'rss kB':>9} {'objects':>9} {'sprites':>8} {'pooled':>7}")
+    for round_number in range(1, args.rounds + 1):
+        game.simulate(args.frames, FIXED_DT)
+        game.high_scores_manager.add_high_score('soak', game.score.current_score)
+        game.reset_game()
+
+        if round_number == WARMUP_ROUNDS or round_number % 25 == 0 or round_number == args.rounds:
+            sample = (rss_kb(), *live_objects())
+            if round_number == WARMUP_ROUNDS:
+                baseline = sample
+            print(f'{round_number:>6} {sample[0]:>9} {sample[1]:>9} {sample[2]:>8} {sample[3]:>7}')
+    game.close()
+    directory.cleanup()
+
+    rss_growth = sample[0] - baseline[0]
+    object_growth = (sample[1] - baseline[1]) / baseline[1]
+    print(f'after warm-up: rss {rss_growth:+} kB, objects {object_growth:+.2%}, sprites {sample[2] - baseline[2]:+}')
+    if rss_growth > MAX_RSS_GROWTH_KB or object_growth > MAX_OBJECT_GROWTH or sample[2] > baseline[2]:
+        print('memory is growing across rounds')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+from time import perf_counter, sleep
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+import pygame
+from engine_support import RandomInput, interval_stats
+from levels.main import Game
+from ui import GameState
+
+SECONDS = 6
+SEED = 4
+LOGIC_HZ = 60
+STALL_EVERY = 20
+STALL_MS = 45
+MODES = {
+    'variable dt': {},
+    'fixed steps': {'logic_hz': LOGIC_HZ},
+    'threaded': {'logic_hz': LOGIC_HZ, 'threaded': True},
+}
+
+
+def run(options):
+    """
+     Plays SECONDS of real time with an invulnerable random pilot. Every STALL_EVERY frames present()
+     blocks for STALL_MS, the way a missed vsync or a busy compositor would.
+    """
+    game = Game(controls=RandomInput(SEED), seed=SEED, **options)
+    game.load_gameplay()
+    game.health.reduce = lambda amount: None
+
+    step_times = []
+    step = game.step
+
+    def timed_step(dt):
+        step_times.append(perf_counter())
+        step(dt)
+
+    present = game.present
+    frames = 0
+
+    def stalling_present():
+        nonlocal frames
+        present()
+        frames += 1
+        if frames % STALL_EVERY == 0:
+            sleep(STALL_MS / 1000)
+
+    game.step = timed_step
+    game.present = stalling_present
+    game.change_state(GameState.PLAYING)
+    end = perf_counter() + SECONDS
+    while perf_counter() < end:
+        pygame.event.pump()
+        if game.threaded:
+            game.play_threaded_frame()
+        else:
+            game.play_frame()
+    game.change_state(GameState.MAIN_MENU)
+    game.close()
+    return interval_stats(step_times, 1000 / LOGIC_HZ), interval_stats(game.render_times, 1000 / game.fps)
+
+
+def main():
+    print(f'{SECONDS} s per mode, logic at {LOGIC_HZ} Hz, a {STALL_MS} ms display stall every {STALL_EVERY} frames')
+    print(f"{'mode':>12} {'thread':>7} {'intervals':>10} {'mean ms':>8} {'std ms':>7} {'p99 dev':>8} {'max dev':>8}")
+    for mode, options in MODES.items():
+        for thread, stats in zip(('sim', 'render'), run(options)):
+            print(f"{mode:>12} {thread:>7} {stats['count']:>10} {stats['mean']:>8.2f} {stats['std']:>7.2f} "
+                  f"{stats['p99']:>8.2f} {stats['max_dev']:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
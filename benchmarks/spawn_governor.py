@@ -0,0 +1,57 @@
+from time import perf_counter
+from benchmarks import use_dummy_drivers
+
+use_dummy_drivers()
+
+from engine_support import RandomInput, FRAME_BUDGET_MS
+from levels.main import Game, FIXED_DT
+
+FRAMES = 900
+SEED = 3
+LOAD_PER_SPRITE_MS = 0.4
+
+
+def busy(milliseconds):
+    end = perf_counter() + milliseconds / 1000
+    while perf_counter() < end:
+        pass
+
+
+def run(governed):
+    """
+     Plays FRAMES frames on a simulated slow machine where every sprite on screen costs LOAD_PER_SPRITE_MS.
+    """
+    game = Game(headless=True, controls=RandomInput(SEED), seed=SEED)
+    over_budget = 0
+    frame_times = []
+    for _ in range(FRAMES):
+        start = perf_counter()
+        game.game_clock.advance(FIXED_DT)
+        game.draw()
+        game.step(FIXED_DT)
+        busy(len(game.all_sprites) * LOAD_PER_SPRITE_MS)
+        frame_ms = (perf_counter() - start) * 1000
+        if governed:
+            game.spawner.record_frame(frame_ms)
+        game.health.width = game.health.initial_width
+
+        frame_times.append(frame_ms)
+        over_budget += frame_ms > FRAME_BUDGET_MS
+    game.close()
+
+    frame_times.sort()
+    stats = game.spawner.stats()
+    return over_budget, frame_times[len(frame_times) // 2], frame_times[int(len(frame_times) * 0.95)], stats
+
+
+def main():
+    print(f"{'governor':>9} {'over budget':>12} {'p50 ms':>7} {'p95 ms':>7} {'meteors':>8} {'stars':>6} {'held':>6}")
+    for governed in (False, True):
+        over, p50, p95, stats = run(governed)
+        held = stats['meteors_held'] + stats['stars_held']
+        print(f"{'on' if governed else 'off':>9} {over:>8}/{FRAMES} {p50:>7.2f} {p95:>7.2f} "
+              f"{stats['meteors_spawned']:>8} {stats['stars_spawned']:>6} {held:>6}")
+
+
+if __name__ == '__main__':
+    main()
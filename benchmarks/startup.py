@@ -0,0 +1,60 @@
+import os
+import re
+import subprocess
+import sys
+from statistics import median
+
+RUNS = 5
+
+FIRST_FRAME = '''
+from time import perf_counter
+start = perf_counter()
+import pygame
+from levels.main import Game
+imported = perf_counter()
+game = Game()
+game.draw_state()
+pygame.display.flip()
+menu = perf_counter()
+game.load_gameplay()
+ready = perf_counter()
+print((imported - start) * 1000, (menu - start) * 1000, (ready - start) * 1000)
+game.close()
+'''
+
+
+def run(*args):
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    return subprocess.run([sys.executable, *args], env=env, capture_output=True, text=True, check=True)
+
+
+def import_time():
+    """
+     Cumulative microseconds python -X importtime reports for levels.main, and the three slowest imports.
+    """
+    rows = []
+    for line in run('-X', 'importtime', '-c', 'import levels.main').stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|\s*(.+)', line)
+        if match:
+            rows.append((int(match.group(2)), match.group(3).strip()))
+    total = next(cumulative for cumulative, name in rows if name == 'levels.main')
+    top_level = [row for row in rows if not row[1].startswith(' ') and '.' not in row[1]]
+    return total / 1000, sorted(top_level, reverse=True)[:3]
+
+
+def main():
+    imports = []
+    for _ in range(RUNS):
+        total, slowest = import_time()
+        imports.append(total)
+    print(f'import levels.main: {median(imports):.1f} ms')
+    for cumulative, name in slowest:
+        print(f'  {name:<12} {cumulative / 1000:.1f} ms')
+
+    samples = [[float(value) for value in run('-c', FIRST_FRAME).stdout.split()] for _ in range(RUNS)]
+    for index, label in enumerate(('imports done', 'first menu frame', 'gameplay ready')):
+        print(f'{label}: {median(sample[index] for sample in samples):.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
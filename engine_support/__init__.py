@@ -1,3 +1,21 @@
 from .settings import *
 from .support import *
 from .sounds import *
+from .atlas import *
+from .assets import *
+from .audio import *
+from .pool import *
+from .collisions import *
+from .clock import *
+from .controls import *
+from .replay import *
+from .profiler import *
+from .text import *
+from .entity_store import *
+from .io_worker import *
+from .manifest import *
+from .loader import *
+from .spawner import *
+from .scene import *
+from .sim_thread import *
+from .background import *
@@ -0,0 +1,126 @@
+import pygame
+from collections import OrderedDict
+from os.path import join
+from .manifest import asset_manifest
+from .atlas import texture_atlas
+from .collisions import HitShape
+from .support import folder_importer, folder_files, decode_files, image_transformer, png_image_cutter
+
+
+class FrameSet:
+    def __init__(self, images, masks=None):
+        self.images = images
+        self.masks = masks if masks is not None else [pygame.mask.from_surface(image) for image in images]
+        self.shapes = [None] * len(images)
+
+    def __len__(self):
+        return len(self.images)
+
+    def __getitem__(self, index):
+        return self.images[index]
+
+    def hit_shape(self, index=0):
+        """
+         Tight HitShape of a frame, built on first use and shared by every sprite showing that frame.
+        """
+        if self.shapes[index] is None:
+            self.shapes[index] = HitShape(self.masks[index])
+        return self.shapes[index]
+
+
+class AssetCache:
+    """
+    Process-wide store of loaded, scaled and masked frame sets.
+    Entries are keyed by source path and target size and evicted least recently used first.
+    Frames packed into the texture atlas are sliced from it instead of being decoded and scaled.
+    """
+    def __init__(self, max_entries=64, atlas=None):
+        self.max_entries = max_entries
+        self.atlas = atlas
+        self.entries = OrderedDict()
+        self.decoded = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, key, loader):
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        self.misses += 1
+        packed = self.atlas.frames(key) if self.atlas is not None else None
+        frame_set = FrameSet(*packed) if packed is not None else FrameSet(loader())
+        self.entries[key] = frame_set
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return frame_set
+
+    def read(self, full_path):
+        """
+         Returns a surface decoded ahead of time by prefetch(), or loads the file now.
+        """
+        surface = self.decoded.pop(full_path, None)
+        return surface if surface is not None else pygame.image.load(asset_manifest.resolve(full_path))
+
+    def prefetch(self, worker, kind, path, *args, **kwargs):
+        """
+         Decodes the files behind folder()/image()/sheet() on the I/O worker. When the worker's results
+         are drained the frame set is built on the game thread, so later lookups are cache hits.
+         With an atlas present the atlas pages are decoded instead, once.
+        """
+        if self.atlas is not None and self.atlas.available:
+            return self.atlas.prefetch(worker)
+
+        def decode():
+            return decode_files(folder_files(*path) if kind == 'folder' else [join(*path)])
+
+        def complete(surfaces):
+            self.decoded.update(surfaces)
+            getattr(self, kind)(path, *args, **kwargs)
+            for full_path in surfaces:
+                self.decoded.pop(full_path, None)
+
+        return worker.submit(decode, callback=complete)
+
+    def folder(self, path, size=None):
+        def loader():
+            images = folder_importer(*path, loader=self.read)
+            if size is None:
+                return images
+            return [image_transformer(image, *size) for image in images]
+        return self.load(('folder', join(*path), size), loader)
+
+    def image(self, path, size=None, angle=0, smooth=True):
+        def loader():
+            image = self.read(join(*path)).convert_alpha()
+            if angle:
+                image = pygame.transform.rotate(image, angle)
+            if size is not None:
+                image = image_transformer(image, *size) if smooth else pygame.transform.scale(image, size)
+            return [image]
+        return self.load(('image', join(*path), size, angle, smooth), loader)
+
+    def sheet(self, path, frame_width, frame_height, size=None):
+        def loader():
+            frames = png_image_cutter(join(*path), frame_width, frame_height, loader=self.read)
+            if size is None:
+                return frames
+            return [image_transformer(frame, *size) for frame in frames]
+        return self.load(('sheet', join(*path), frame_width, frame_height, size), loader)
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+        }
+
+
+asset_cache = AssetCache(atlas=texture_atlas)
@@ -0,0 +1,127 @@
+import json
+import pygame
+from os import makedirs
+from os.path import join, exists
+from .manifest import asset_manifest, manifest_key
+from .support import atlas_cutter
+
+ATLAS_DIR = join('assets', 'atlas')
+ATLAS_INDEX = join(ATLAS_DIR, 'atlas.json')
+ATLAS_PAGE_SIZE = 2048
+ATLAS_PADDING = 1
+
+
+def atlas_key(key):
+    """
+     Turns an AssetCache key into the string used in the atlas index.
+    """
+    return json.dumps([key[0], manifest_key(key[1]), *key[2:]])
+
+
+def pack(sizes, page_size=ATLAS_PAGE_SIZE, padding=ATLAS_PADDING):
+    """
+     Shelf packer: places the tallest frames first, left to right in rows, opening a new page when one fills up.
+     Returns a (page, x, y) tuple for each (width, height) in sizes.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    placements = [None] * len(sizes)
+    page = x = y = shelf = 0
+    for i in order:
+        width, height = sizes[i]
+        if x + width > page_size:
+            x, y, shelf = 0, y + shelf + padding, 0
+        if y + height > page_size:
+            page, x, y, shelf = page + 1, 0, 0, 0
+        placements[i] = (page, x, y)
+        x += width + padding
+        shelf = max(shelf, height)
+    return placements
+
+
+def build_atlas(frame_sets, directory=ATLAS_DIR):
+    """
+     Packs every frame of the given {cache key: FrameSet} into atlas pages, with a matching page of
+     collision masks (white where the mask is set), and writes the pages and an index to directory.
+    """
+    makedirs(directory, exist_ok=True)
+    frames = [(key, image, mask) for key, frame_set in frame_sets.items()
+              for image, mask in zip(frame_set.images, frame_set.masks)]
+    placements = pack([image.get_size() for _, image, _ in frames])
+
+    extents = {}
+    for (_, image, _), (page, x, y) in zip(frames, placements):
+        width, height = extents.get(page, (0, 0))
+        extents[page] = (max(width, x + image.get_width()), max(height, y + image.get_height()))
+
+    pages = [pygame.Surface(extents[page], pygame.SRCALPHA) for page in sorted(extents)]
+    mask_pages = [pygame.Surface(extents[page]) for page in sorted(extents)]
+    entries = {}
+    for (key, image, mask), (page, x, y) in zip(frames, placements):
+        pages[page].blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        mask_pages[page].blit(mask.to_surface(), (x, y))
+        entries.setdefault(atlas_key(key), []).append([page, x, y, *image.get_size()])
+
+    index = {'pages': [], 'entries': entries}
+    for page, (image, mask) in enumerate(zip(pages, mask_pages)):
+        image_path = join(directory, f'atlas_{page}.png')
+        mask_path = join(directory, f'atlas_{page}_mask.png')
+        pygame.image.save(image, image_path)
+        pygame.image.save(mask, mask_path)
+        index['pages'].append([image_path.replace('\\', '/'), mask_path.replace('\\', '/')])
+
+    with open(join(directory, 'atlas.json'), 'w') as file:
+        json.dump(index, file, indent=1, sort_keys=True)
+    return index
+
+
+class TextureAtlas:
+    """
+     Runtime side of the atlas: decodes every page once and hands out frames as subsurfaces.
+     Keys that were not packed, e.g. after a size change in settings, fall back to the normal loaders.
+    """
+    def __init__(self, filename=ATLAS_INDEX):
+        self.filename = filename
+        self.index = None
+        self.pages = None
+        self.prefetching = False
+
+    def load_index(self):
+        if self.index is None:
+            filename = asset_manifest.resolve(self.filename)
+            if exists(filename):
+                with open(filename, 'r') as file:
+                    self.index = json.load(file)
+            else:
+                self.index = {'pages': [], 'entries': {}}
+        return self.index
+
+    @property
+    def available(self):
+        return bool(self.load_index()['pages'])
+
+    def decode(self):
+        return [(pygame.image.load(asset_manifest.resolve(image)), pygame.image.load(asset_manifest.resolve(mask)))
+                for image, mask in self.load_index()['pages']]
+
+    def set_pages(self, decoded):
+        if self.pages is None:
+            self.pages = [(image.convert_alpha(), mask.convert()) for image, mask in decoded]
+
+    def prefetch(self, worker):
+        if self.pages is None and not self.prefetching:
+            self.prefetching = True
+            return worker.submit(self.decode, callback=self.set_pages)
+
+    def frames(self, key):
+        """
+         Returns (images, masks) for a cache key, or None when the key is not in the atlas.
+        """
+        rects = self.load_index()['entries'].get(atlas_key(key))
+        if rects is None:
+            return None
+        if self.pages is None:
+            self.set_pages(self.decode())
+        return atlas_cutter(self.pages, rects)
+
+
+texture_atlas = TextureAtlas()
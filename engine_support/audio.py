@@ -0,0 +1,120 @@
+import pygame
+from .manifest import asset_manifest
+
+
+class SoundClip:
+    def __init__(self, sound, voices, priority):
+        self.sound = sound
+        self.voices = voices
+        self.priority = priority
+
+
+class AudioManager:
+    """
+     Decodes each sound once and plays it through a fixed set of mixer channels.
+     play() only queues a sound for the current frame, so repeats in one frame merge into a single voice.
+     flush() starts the queued sounds: a sound at its voice limit restarts its oldest voice, and when every
+     channel is busy the oldest voice of a lower priority sound is stolen.
+    """
+    def __init__(self, channels=16):
+        self.channel_count = channels
+        self.channels = None
+        self.owners = []
+        self.clips = {}
+        self.requested = []
+        self.frame = 0
+        self.played = 0
+        self.merged = 0
+        self.recycled = 0
+        self.stolen = 0
+        self.dropped = 0
+
+    def register(self, name, path, volume=1.0, voices=2, priority=0):
+        if name not in self.clips:
+            sound = pygame.mixer.Sound(asset_manifest.resolve(path)) if pygame.mixer.get_init() else None
+            if sound is not None:
+                sound.set_volume(volume)
+            self.clips[name] = SoundClip(sound, voices, priority)
+        return self.clips[name]
+
+    def play(self, name):
+        if name in self.requested:
+            self.merged += 1
+        else:
+            self.requested.append(name)
+
+    def open(self):
+        if not pygame.mixer.get_init():
+            self.channels = []
+            return
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), self.channel_count))
+        self.channels = [pygame.mixer.Channel(index) for index in range(self.channel_count)]
+        self.owners = [None] * self.channel_count
+
+    def flush(self):
+        """
+         Starts the sounds queued since the last call. Called once per frame.
+        """
+        self.frame += 1
+        if not self.requested:
+            return
+        if self.channels is None:
+            self.open()
+        for name in self.requested:
+            self.start(name)
+        self.requested.clear()
+
+    def start(self, name):
+        clip = self.clips[name]
+        if clip.sound is None or not self.channels:
+            return
+
+        owners = self.owners
+        free = None
+        voices = []
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                owners[index] = None
+                if free is None:
+                    free = index
+            elif owners[index] is not None and owners[index][0] == name:
+                voices.append(index)
+
+        if len(voices) >= clip.voices:
+            index = min(voices, key=lambda i: owners[i][1])
+            self.recycled += 1
+        elif free is not None:
+            index = free
+        else:
+            lower = [i for i in range(len(owners)) if self.rank(i) < (clip.priority, 0)]
+            if not lower:
+                self.dropped += 1
+                return
+            index = min(lower, key=self.rank)
+            self.stolen += 1
+
+        self.channels[index].play(clip.sound)
+        owners[index] = (name, self.frame)
+        self.played += 1
+
+    def rank(self, index):
+        """
+         Steal order for a busy channel: lowest priority first, then oldest. Channels played outside the manager go first.
+        """
+        owner = self.owners[index]
+        if owner is None:
+            return -1, 0
+        return self.clips[owner[0]].priority, owner[1]
+
+    def stats(self):
+        return {
+            'played': self.played,
+            'merged': self.merged,
+            'recycled': self.recycled,
+            'stolen': self.stolen,
+            'dropped': self.dropped,
+            'busy': sum(channel.get_busy() for channel in self.channels or ()),
+        }
+
+
+audio_manager = AudioManager()
@@ -0,0 +1,72 @@
+import pygame
+import random
+
+STAR_KEY = (255, 0, 255)
+STARFIELD_LAYERS = (
+    # pixels per second of game time, stars, radius, brightness
+    (18, 70, 1, 120),
+    (45, 40, 1, 200),
+)
+strip_cache = {}
+
+
+def starfield_strip(size, speed, count, radius, brightness, seed=0):
+    """
+     One parallax layer: a colour-keyed, RLE-encoded surface of scattered stars that tiles vertically.
+     Strips are built once per set of parameters and shared by every Background.
+    """
+    key = (size, speed, count, radius, brightness, seed)
+    if key not in strip_cache:
+        width, height = size
+        rng = random.Random(repr(key))
+        strip = pygame.Surface(size).convert()
+        strip.fill(STAR_KEY)
+        for _ in range(count):
+            x, y = rng.randrange(width), rng.randrange(height)
+            shade = rng.randint(brightness // 2, brightness)
+            for wrapped in (y - height, y, y + height):
+                pygame.draw.circle(strip, (shade, shade, shade), (x, wrapped), radius)
+        strip.set_colorkey(STAR_KEY, pygame.RLEACCEL)
+        strip_cache[key] = strip
+    return strip_cache[key]
+
+
+class Background:
+    """
+     The play field behind the sprites, drawn with opaque and colour-keyed blits only. The picture is flattened
+     onto the fill colour once, in the display's pixel format without alpha. Starfield layers scroll over it
+     at their own speed, placed from game time, so draw() needs no per-frame state. Until set_image() has run
+     draw() just fills the colour.
+    """
+    def __init__(self, size, color, layers=STARFIELD_LAYERS, seed=0):
+        self.size = size
+        self.color = color
+        self.layers = layers
+        self.seed = seed
+        self.base = None
+        self.strips = []
+        self.static = None
+
+    def set_image(self, image):
+        self.base = pygame.Surface(self.size).convert()
+        self.base.fill(self.color)
+        self.base.blit(image, (0, 0))
+        self.strips = [(speed, starfield_strip(self.size, speed, count, radius, brightness, self.seed))
+                       for speed, count, radius, brightness in self.layers]
+
+        self.static = self.base.copy()
+        for _, strip in self.strips:
+            self.static.blit(strip, (0, 0))
+
+    def draw(self, surface, time_ms=0.0):
+        if self.base is None:
+            surface.fill(self.color)
+            return
+
+        surface.blit(self.base, (0, 0))
+        width, height = self.size
+        for speed, strip in self.strips:
+            # The strip wraps at offset: its bottom band covers the top of the screen and its top band the rest
+            offset = int(time_ms * speed / 1000) % height
+            surface.blit(strip, (0, 0), (0, height - offset, width, offset))
+            surface.blit(strip, (0, offset), (0, 0, width, height - offset))
@@ -0,0 +1,93 @@
+import pygame
+
+EPSILON = 1e-6
+
+
+class Animation:
+    """
+     Frame index that advances at `fps` frames per second of game time since the last restart().
+     Looping animations wrap around. The others hold their last frame and report finished.
+    """
+    def __init__(self, clock, frame_count, fps, loop=True):
+        self.clock = clock
+        self.frame_count = frame_count
+        self.fps = fps
+        self.loop = loop
+        self.started = clock.now()
+
+    def restart(self):
+        self.started = self.clock.now()
+
+    @property
+    def position(self):
+        return (self.clock.now() - self.started) * self.fps / 1000 + EPSILON
+
+    @property
+    def finished(self):
+        return not self.loop and self.position >= self.frame_count
+
+    @property
+    def frame(self):
+        index = int(self.position)
+        return index % self.frame_count if self.loop else min(index, self.frame_count - 1)
+
+
+class Timer:
+    """
+     Counts whole periods of game time. due() returns how many periods ended since it last counted them,
+     so a rate per period holds even when logic steps less often than once per period.
+    """
+    def __init__(self, clock, period):
+        self.clock = clock
+        self.period = period
+        self.last = clock.now()
+
+    def restart(self):
+        self.last = self.clock.now()
+
+    def due(self):
+        periods = int((self.clock.now() - self.last + EPSILON) // self.period)
+        self.last += periods * self.period
+        return periods
+
+
+class GameClock:
+    """
+     Source of game time for the animations and timers that sprites and bars take from it.
+    """
+    def animation(self, frame_count, fps, loop=True):
+        return Animation(self, frame_count, fps, loop)
+
+    def timer(self, period):
+        return Timer(self, period)
+
+
+class RealClock(GameClock):
+    def advance(self, dt):
+        pass
+
+    def now(self):
+        return pygame.time.get_ticks()
+
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+
+class SimulationClock(GameClock):
+    """
+     Game time that only moves when advance() is called, once per logic step, whatever the step rate.
+    """
+    def __init__(self, start=0):
+        self.time = start
+
+    def advance(self, dt):
+        self.time += dt * 1000
+
+    def now(self):
+        return self.time
+
+    def get_ticks(self):
+        return int(self.time)
+
+
+real_clock = RealClock()
@@ -0,0 +1,108 @@
+import pygame
+from math import ceil
+
+
+class HitShape:
+    """
+     Tight collision shape of a mostly transparent image: the bounding box of its mask, as an offset inside
+     the image and a size, and the mask cropped to that box.
+    """
+    def __init__(self, mask):
+        bounds = mask.get_bounding_rects()
+        crop = bounds[0].unionall(bounds[1:]) if bounds else pygame.Rect(0, 0, 0, 0)
+        self.offset = crop.topleft
+        self.size = crop.size
+        self.mask = pygame.Mask(crop.size)
+        self.mask.draw(mask, (-crop.x, -crop.y))
+
+    def rect(self, rect):
+        return pygame.Rect(rect.x + self.offset[0], rect.y + self.offset[1], *self.size)
+
+
+def collide_hitbox(sprite, other):
+    """
+     collide_mask for a sprite with a hit_shape: compares the cropped mask, placed at its offset in sprite.rect,
+     with the other sprite's mask. Pair it with the shape's rect as the broadphase rect test.
+    """
+    shape = sprite.hit_shape
+    x = sprite.rect.x + shape.offset[0]
+    y = sprite.rect.y + shape.offset[1]
+    return shape.mask.overlap(other.mask, (other.rect.x - x, other.rect.y - y)) is not None
+
+
+class Broadphase:
+    """
+     Finds the sprites of a group that may touch a rect. build() is called once per frame
+     with the group to test against, then spritecollide() for every probing sprite.
+    """
+    def __init__(self):
+        self.group = None
+
+    def build(self, group):
+        self.group = group
+
+    def candidates(self, rect):
+        return self.group.sprites()
+
+    def spritecollide(self, sprite, dokill=False, collided=None, rect=None):
+        """
+         rect, when given, replaces sprite.rect for the candidate search and the rect test, e.g. a tight hitbox.
+        """
+        rect = rect if rect is not None else sprite.rect
+        hits = []
+        for other in self.candidates(rect):
+            if other in self.group and rect.colliderect(other.rect):
+                if collided is None or collided(sprite, other):
+                    hits.append(other)
+
+        if dokill:
+            for other in hits:
+                other.kill()
+        return hits
+
+
+class BruteForceBroadphase(Broadphase):
+    pass
+
+
+class SpatialHash(Broadphase):
+    def __init__(self, width, height, cell_size=128):
+        super().__init__()
+        self.cell_size = cell_size
+        self.columns = ceil(width / cell_size)
+        self.rows = ceil(height / cell_size)
+        self.cells = [[] for _ in range(self.columns * self.rows)]
+
+    def cell_range(self, rect):
+        size = self.cell_size
+        left = min(max(rect.left // size, 0), self.columns - 1)
+        right = min(max((rect.right - 1) // size, 0), self.columns - 1)
+        top = min(max(rect.top // size, 0), self.rows - 1)
+        bottom = min(max((rect.bottom - 1) // size, 0), self.rows - 1)
+        return left, right, top, bottom
+
+    def build(self, group):
+        super().build(group)
+        for cell in self.cells:
+            cell.clear()
+
+        for sprite in group:
+            left, right, top, bottom = self.cell_range(sprite.rect)
+            for row in range(top, bottom + 1):
+                for column in range(left, right + 1):
+                    self.cells[row * self.columns + column].append(sprite)
+
+    def candidates(self, rect):
+        left, right, top, bottom = self.cell_range(rect)
+        if left == right and top == bottom:
+            return self.cells[top * self.columns + left]
+
+        found = []
+        seen = set()
+        for row in range(top, bottom + 1):
+            for column in range(left, right + 1):
+                for sprite in self.cells[row * self.columns + column]:
+                    if sprite not in seen:
+                        seen.add(sprite)
+                        found.append(sprite)
+        return found
@@ -0,0 +1,122 @@
+import pygame
+import random
+from .settings import WINDOW_WIDTH
+
+LEFT = 1
+RIGHT = 2
+UP = 4
+DOWN = 8
+SHOOT = 16
+
+
+class KeyboardInput:
+    def poll(self):
+        keys = pygame.key.get_pressed()
+        return ((LEFT if keys[pygame.K_LEFT] else 0) | (RIGHT if keys[pygame.K_RIGHT] else 0) |
+                (UP if keys[pygame.K_UP] else 0) | (DOWN if keys[pygame.K_DOWN] else 0) |
+                (SHOOT if keys[pygame.K_SPACE] else 0))
+
+
+class LatchedInput:
+    """
+     Polls another input when the game thread calls sample() and hands that mask to every poll(),
+     so a player stepped on the simulation thread never reads the keyboard itself.
+    """
+    def __init__(self, source):
+        self.source = source
+        self.buttons = 0
+
+    def sample(self):
+        self.buttons = self.source.poll()
+
+    def poll(self):
+        return self.buttons
+
+
+class ScriptedInput:
+    """
+     Plays back a fixed list of per-frame button masks, looping when it runs out.
+    """
+    def __init__(self, frames, loop=True):
+        self.frames = list(frames)
+        self.loop = loop
+        self.index = 0
+
+    def poll(self):
+        if self.index >= len(self.frames):
+            if not self.loop or not self.frames:
+                return 0
+            self.index = 0
+        buttons = self.frames[self.index]
+        self.index += 1
+        return buttons
+
+
+class RandomInput:
+    """
+     Seeded pilot that holds a random combination of buttons for a few frames at a time.
+    """
+    def __init__(self, seed=0, hold_frames=15):
+        self.random = random.Random(seed)
+        self.hold_frames = hold_frames
+        self.frames_left = 0
+        self.buttons = 0
+
+    def poll(self):
+        if self.frames_left == 0:
+            self.buttons = self.random.randrange(SHOOT * 2)
+            self.frames_left = self.hold_frames
+        self.frames_left -= 1
+        return self.buttons
+
+
+class AutoPilot:
+    """
+     Scripted pilot for balancing runs. Dodges meteors predicted to reach the ship within `horizon` seconds,
+     otherwise lines up under the lowest meteor and fires. attach() hands it the player and the meteor group.
+    """
+    def __init__(self, horizon=0.8, margin=30, lead=0.3):
+        self.horizon = horizon
+        self.margin = margin
+        self.lead = lead
+        self.player = None
+        self.meteors = ()
+
+    def attach(self, player, meteors):
+        self.player = player
+        self.meteors = meteors
+
+    def poll(self):
+        if self.player is None:
+            return 0
+
+        ship = self.player.rect
+        threats = []
+        target = None
+        for meteor in self.meteors:
+            rect = meteor.rect
+            if rect.top > ship.bottom:
+                continue
+            velocity_x, velocity_y = meteor.velocity
+            time_to_ship = max(0.0, (ship.top - rect.bottom) / velocity_y)
+            if time_to_ship < self.horizon:
+                predicted_x = rect.centerx + velocity_x * time_to_ship
+                if abs(predicted_x - ship.centerx) < (ship.width + rect.width) / 2 + self.margin:
+                    threats.append(predicted_x)
+            elif target is None or rect.bottom > target.rect.bottom:
+                target = meteor
+
+        if threats:
+            go_left = sum(threats) / len(threats) > ship.centerx
+            if (go_left and ship.left <= 0) or (not go_left and ship.right >= WINDOW_WIDTH):
+                go_left = not go_left
+            return LEFT if go_left else RIGHT
+
+        buttons = 0
+        if target is not None:
+            offset = target.rect.centerx + target.velocity.x * self.lead - ship.centerx
+            if abs(offset) > 10:
+                buttons |= RIGHT if offset > 0 else LEFT
+            if abs(offset) < target.rect.width / 2:
+                buttons |= SHOOT
+        return buttons
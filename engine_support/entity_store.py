@@ -0,0 +1,156 @@
+from array import array
+
+COLUMNS = ('x', 'y', 'vx', 'vy', 'phase')
+numpy = None
+
+
+def load_numpy():
+    """
+     Imports NumPy the first time a store is built rather than at startup. Returns False when it is missing.
+    """
+    global numpy
+    if numpy is None:
+        try:
+            import numpy as module
+        except ImportError:
+            module = False
+        numpy = module
+    return numpy
+
+
+class EntityStore:
+    """
+     Keeps position, velocity, animation phase and alive flags for many simple sprites in contiguous columns.
+     Velocities are in pixels and animation in frames per second of game time, so neither depends on the step rate.
+     step() integrates, animates and culls every entity in batch; sync() copies the result to the sprites
+     so drawing and collisions keep working on rects, images and masks.
+     Uses NumPy when it is installed and falls back to the array module otherwise.
+    """
+    def __init__(self, capacity=64, frames=None, masks=None, animation_fps=0.0, half_height=0, cull_y=0):
+        self.capacity = capacity
+        self.frames = frames
+        self.masks = masks
+        self.frame_count = len(frames) if frames else 1
+        self.animation_fps = animation_fps
+        self.half_height = half_height
+        self.cull_y = cull_y
+        load_numpy()
+
+        self.count = 0
+        self.free = []
+        self.sprites = [None] * capacity
+        self.columns = {name: self.new_column(capacity) for name in COLUMNS}
+        self.alive = numpy.zeros(capacity, dtype=bool) if numpy else bytearray(capacity)
+
+    def new_column(self, size):
+        return numpy.zeros(size) if numpy else array('d', bytes(8 * size))
+
+    def grow(self):
+        extra = self.capacity
+        for name in COLUMNS:
+            column = self.columns[name]
+            if numpy:
+                self.columns[name] = numpy.concatenate((column, numpy.zeros(extra)))
+            else:
+                column.extend(self.new_column(extra))
+        self.alive = numpy.concatenate((self.alive, numpy.zeros(extra, dtype=bool))) if numpy else \
+            self.alive + bytearray(extra)
+        self.sprites.extend([None] * extra)
+        self.capacity += extra
+
+    def add(self, sprite, x, y, vx, vy):
+        if self.free:
+            slot = self.free.pop()
+        else:
+            if self.count == self.capacity:
+                self.grow()
+            slot = self.count
+            self.count += 1
+
+        columns = self.columns
+        columns['x'][slot] = x
+        columns['y'][slot] = y
+        columns['vx'][slot] = vx
+        columns['vy'][slot] = vy
+        columns['phase'][slot] = 0
+        self.alive[slot] = True
+        self.sprites[slot] = sprite
+        return slot
+
+    def remove(self, slot, sprite):
+        if self.alive[slot] and self.sprites[slot] is sprite:
+            self.alive[slot] = False
+            self.sprites[slot] = None
+            self.free.append(slot)
+
+    def clear(self):
+        self.count = 0
+        self.free.clear()
+        self.sprites = [None] * self.capacity
+        if numpy:
+            self.alive[:] = False
+        else:
+            self.alive = bytearray(self.capacity)
+
+    def __len__(self):
+        return self.count - len(self.free)
+
+    def step(self, dt):
+        """
+         Moves and animates every entity and returns the sprites whose top edge passed cull_y.
+        """
+        if numpy:
+            return self.step_numpy(dt)
+        return self.step_array(dt)
+
+    def step_numpy(self, dt):
+        n = self.count
+        x, y, vx, vy, phase = (self.columns[name][:n] for name in COLUMNS)
+        alive = self.alive[:n]
+
+        x += vx * dt
+        y += vy * dt
+        if self.animation_fps:
+            phase += self.animation_fps * dt
+            phase %= self.frame_count
+
+        culled = numpy.flatnonzero(alive & (y - self.half_height > self.cull_y))
+        return [self.sprites[slot] for slot in culled.tolist()]
+
+    def step_array(self, dt):
+        x, y, vx, vy, phase = (self.columns[name] for name in COLUMNS)
+        limit = self.cull_y + self.half_height
+        advance = self.animation_fps * dt
+        culled = []
+        for slot in range(self.count):
+            if not self.alive[slot]:
+                continue
+            x[slot] += vx[slot] * dt
+            y[slot] += vy[slot] * dt
+            if advance:
+                phase[slot] = (phase[slot] + advance) % self.frame_count
+            if y[slot] > limit:
+                culled.append(self.sprites[slot])
+        return culled
+
+    def sync(self):
+        n = self.count
+        columns = self.columns
+        if numpy:
+            xs, ys = columns['x'][:n].tolist(), columns['y'][:n].tolist()
+            frame_indices = columns['phase'][:n].astype(int).tolist() if self.frames else None
+        else:
+            xs, ys = columns['x'], columns['y']
+            frame_indices = [int(phase) for phase in columns['phase']] if self.frames else None
+
+        frames, masks, sprites = self.frames, self.masks, self.sprites
+        for slot in range(n):
+            sprite = sprites[slot]
+            if sprite is None:
+                continue
+            sprite.rect.center = (xs[slot], ys[slot])
+            if frames:
+                frame = frame_indices[slot]
+                sprite.image = frames[frame]
+                if masks:
+                    sprite.mask = masks[frame]
@@ -0,0 +1,80 @@
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+
+class IOWorker:
+    """
+     Runs file reads and decodes on a thread pool. Finished jobs wait in a completion queue until the
+     game thread calls drain() once per frame, which runs each job's callback with its result.
+     A job that raised re-raises its exception from drain() or wait() instead.
+    """
+    def __init__(self, workers=2, window=256):
+        self.workers = workers
+        self.executor = None
+        self.completed = queue.SimpleQueue()
+        self.latencies = deque(maxlen=window)
+        self.submitted = 0
+        self.drained = 0
+        self.failed = 0
+
+    def submit(self, function, *args, callback=None):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix='io-worker')
+
+        submitted_at = perf_counter()
+        future = self.executor.submit(function, *args)
+        future.add_done_callback(lambda done: self.completed.put((done, callback, submitted_at)))
+        self.submitted += 1
+        return future
+
+    def complete(self, future, callback, submitted_at):
+        self.drained += 1
+        self.latencies.append((perf_counter() - submitted_at) * 1000)
+        if future.exception() is not None:
+            self.failed += 1
+            raise future.exception()
+        if callback is not None:
+            callback(future.result())
+
+    def drain(self, limit=None):
+        handled = 0
+        while limit is None or handled < limit:
+            try:
+                job = self.completed.get_nowait()
+            except queue.Empty:
+                break
+            self.complete(*job)
+            handled += 1
+        return handled
+
+    def wait(self):
+        """
+         Blocks until every submitted job has finished and its callback has run.
+        """
+        while self.drained < self.submitted:
+            self.complete(*self.completed.get())
+
+    @property
+    def queue_depth(self):
+        return self.submitted - self.drained
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+        return {
+            'submitted': self.submitted,
+            'drained': self.drained,
+            'failed': self.failed,
+            'queue_depth': self.queue_depth,
+            'latency_p50': latencies[len(latencies) // 2] if latencies else 0.0,
+            'latency_max': latencies[-1] if latencies else 0.0,
+        }
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+
+io_worker = IOWorker()
@@ -0,0 +1,41 @@
+from time import perf_counter
+
+
+class LoadingStage:
+    """
+     Runs a list of (label, task) pairs a few at a time so the caller can keep drawing between steps.
+    """
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+        self.index = 0
+        self.timings = {}
+
+    @property
+    def finished(self):
+        return self.index >= len(self.tasks)
+
+    @property
+    def progress(self):
+        return self.index / len(self.tasks) if self.tasks else 1.0
+
+    @property
+    def label(self):
+        return self.tasks[self.index][0] if not self.finished else ''
+
+    def step(self, budget_ms=None):
+        """
+         Runs tasks until the budget is spent (at least one per call) or all are done. Returns True when finished.
+        """
+        start = perf_counter()
+        while not self.finished:
+            label, task = self.tasks[self.index]
+            task_start = perf_counter()
+            task()
+            self.timings[label] = (perf_counter() - task_start) * 1000
+            self.index += 1
+            if budget_ms is not None and (perf_counter() - start) * 1000 >= budget_ms:
+                break
+        return self.finished
+
+    def run(self):
+        return self.step()
@@ -0,0 +1,80 @@
+import json
+import re
+from os import walk
+from os.path import join, getsize, exists, relpath
+
+MANIFEST_PATH = join('assets', 'manifest.json')
+ASSET_EXTENSIONS = ('.png', '.ttf', '.ogg', '.flac')
+
+
+def natural_key(file_name):
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', file_name)]
+
+
+def manifest_key(path):
+    return path.replace('\\', '/').lower()
+
+
+def build_manifest(root='assets'):
+    """
+     Lists every asset under root with its size, and the sorted contents of each folder.
+     Keys are lower-cased so lookups match the paths used in code whatever the case on disk.
+    """
+    files = {}
+    folders = {}
+    for folder_path, folder_names, file_names in walk(root):
+        folder_names.sort()
+        assets = [join(folder_path, name) for name in sorted(file_names, key=natural_key)
+                  if name.lower().endswith(ASSET_EXTENSIONS)]
+        if not assets:
+            continue
+
+        paths = [relpath(path).replace('\\', '/') for path in assets]
+        folders[manifest_key(relpath(folder_path))] = paths
+        for path in paths:
+            files[manifest_key(path)] = {'path': path, 'bytes': getsize(path)}
+    return {'files': files, 'folders': folders}
+
+
+def write_manifest(filename=MANIFEST_PATH, root='assets'):
+    manifest = build_manifest(root)
+    with open(filename, 'w') as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+    return manifest
+
+
+class AssetManifest:
+    """
+     Read-only view of the generated manifest. Falls back to the file system when there is none.
+    """
+    def __init__(self, filename=MANIFEST_PATH):
+        self.filename = filename
+        self.data = None
+
+    def load(self):
+        if self.data is None:
+            if exists(self.filename):
+                with open(self.filename, 'r') as file:
+                    self.data = json.load(file)
+            else:
+                self.data = {'files': {}, 'folders': {}}
+        return self.data
+
+    def resolve(self, path):
+        entry = self.load()['files'].get(manifest_key(path))
+        return entry['path'] if entry else path
+
+    def folder(self, path):
+        return self.load()['folders'].get(manifest_key(path))
+
+    def size(self, path):
+        entry = self.load()['files'].get(manifest_key(path))
+        return entry['bytes'] if entry else 0
+
+
+asset_manifest = AssetManifest()
+
+
+if __name__ == '__main__':
+    manifest = write_manifest()
+    print(f"wrote {MANIFEST_PATH}: {len(manifest['files'])} files in {len(manifest['folders'])} folders")
@@ -0,0 +1,75 @@
+class Poolable:
+    """
+     Mixin for sprites handed out by a SpritePool. kill() returns the sprite to its pool.
+    """
+    pool = None
+
+    def spawn(self, *args):
+        pass
+
+    def retire(self):
+        """
+         Called when the sprite goes back to the pool. Drops references that should not outlive its use.
+        """
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+class SpritePool:
+    def __init__(self, factory, capacity):
+        self.factory = factory
+        self.capacity = capacity
+        self.free = []
+        self.active = set()
+
+        self.allocated = 0
+        self.reused = 0
+        self.released = 0
+        self.exhausted = 0
+
+    def acquire(self, *args):
+        """
+         Returns a live instance, reusing a released one when possible.
+         Returns None when all instances are in use and the pool is at capacity.
+        """
+        if self.free:
+            instance = self.free.pop()
+            instance.spawn(*args)
+            self.reused += 1
+        elif len(self.active) < self.capacity:
+            instance = self.factory(*args)
+            instance.pool = self
+            self.allocated += 1
+        else:
+            self.exhausted += 1
+            return None
+
+        self.active.add(instance)
+        return instance
+
+    def release(self, instance):
+        if instance in self.active:
+            self.active.remove(instance)
+            instance.retire()
+            self.free.append(instance)
+            self.released += 1
+
+    def reclaim(self):
+        """
+         Takes back instances that left every group without being killed, e.g. after Group.empty().
+        """
+        for instance in [instance for instance in self.active if not instance.alive()]:
+            self.release(instance)
+
+    def stats(self):
+        return {
+            'allocated': self.allocated,
+            'reused': self.reused,
+            'released': self.released,
+            'exhausted': self.exhausted,
+            'active': len(self.active),
+            'free': len(self.free),
+        }
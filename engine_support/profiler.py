@@ -0,0 +1,139 @@
+import csv
+import json
+import sys
+import pygame
+from collections import deque
+from time import perf_counter
+
+PHASES = ('background', 'draw', 'update', 'spawn', 'collisions', 'flip')
+STEP_PHASES = ('update', 'spawn', 'collisions')
+PERCENTILES = (50, 95, 99)
+
+
+class PhaseTimer:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.current[self.name] += (perf_counter() - self.start) * 1000
+
+
+class NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+NULL_TIMER = NullTimer()
+
+
+class FrameProfiler:
+    """
+     Times each phase of a frame in milliseconds and keeps a rolling window per phase for percentiles.
+     With record_trace every finished frame is also appended to a trace that can be exported as CSV or JSON.
+    """
+    def __init__(self, enabled=False, window=600, phases=PHASES, record_trace=False):
+        self.enabled = enabled
+        self.record_trace = record_trace
+        self.phases = phases
+        self.timers = {name: PhaseTimer(self, name) for name in phases}
+        self.current = dict.fromkeys(phases, 0.0)
+        self.samples = {name: deque(maxlen=window) for name in (*phases, 'frame')}
+        self.trace = []
+        self.last_row = None
+        self.frame_start = 0.0
+        self.frame = 0
+
+        self.show_overlay = False
+        self.overlay_font = None
+        self.overlay_image = None
+        self.overlay_interval = 15
+
+    def phase(self, name):
+        return self.timers[name] if self.enabled else NULL_TIMER
+
+    def begin_frame(self):
+        if self.enabled:
+            for name in self.phases:
+                self.current[name] = 0.0
+            self.frame_start = perf_counter()
+
+    def end_frame(self, counts=None, allocations=0):
+        if not self.enabled:
+            return
+
+        total = (perf_counter() - self.frame_start) * 1000
+        for name in self.phases:
+            self.samples[name].append(self.current[name])
+        self.samples['frame'].append(total)
+
+        row = {'frame': self.frame, 'total': total, **self.current, 'allocations': allocations,
+               'allocated_blocks': sys.getallocatedblocks()}
+        if counts:
+            row.update(counts)
+        self.last_row = row
+        if self.record_trace:
+            self.trace.append(row)
+        self.frame += 1
+
+    def percentiles(self, name):
+        values = sorted(self.samples[name])
+        if not values:
+            return dict.fromkeys(PERCENTILES, 0.0)
+        return {p: values[min(len(values) - 1, len(values) * p // 100)] for p in PERCENTILES}
+
+    def summary(self):
+        return {name: self.percentiles(name) for name in self.samples}
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        self.overlay_image = None
+
+    def draw_overlay(self, surface):
+        """
+         Blits the overlay in the top right corner and returns the rect it covered, or None when hidden.
+        """
+        if not (self.enabled and self.show_overlay):
+            return None
+
+        if self.overlay_image is None or self.frame % self.overlay_interval == 0:
+            if self.overlay_font is None:
+                self.overlay_font = pygame.font.Font(None, 22)
+            lines = ['phase        p50    p95    p99']
+            for name, values in self.summary().items():
+                lines.append(f'{name:<10} {values[50]:6.2f} {values[95]:6.2f} {values[99]:6.2f}')
+            last = self.last_row
+            if last:
+                lines.append(' '.join(f'{key}={value}' for key, value in last.items() if key.endswith('sprites')
+                                      or key in ('meteors', 'lasers', 'stars', 'allocations')))
+
+            line_height = self.overlay_font.get_linesize()
+            self.overlay_image = pygame.Surface((520, line_height * len(lines) + 10), pygame.SRCALPHA)
+            self.overlay_image.fill((0, 0, 0, 160))
+            for i, line in enumerate(lines):
+                self.overlay_image.blit(self.overlay_font.render(line, True, (255, 255, 255)), (5, 5 + i * line_height))
+
+        return surface.blit(self.overlay_image, (surface.get_width() - self.overlay_image.get_width() - 10, 10))
+
+    def export(self, filename):
+        if filename.endswith('.json'):
+            with open(filename, 'w') as file:
+                json.dump({'summary': self.summary(), 'frames': self.trace}, file)
+        else:
+            fields = list(self.trace[0]) if self.trace else ['frame', 'total', *self.phases]
+            with open(filename, 'w', newline='') as file:
+                writer = csv.DictWriter(file, fieldnames=fields, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(self.trace)
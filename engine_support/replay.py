@@ -0,0 +1,98 @@
+import struct
+import zlib
+
+REPLAY_MAGIC = b'AFRP'
+REPLAY_VERSION = 2
+HEADER = struct.Struct('<4sBqdII')
+RUN = struct.Struct('<BH')
+MAX_RUN = 0xFFFF
+
+
+class InputRecorder:
+    """
+     Wraps an input source and keeps every button mask it returns, one per frame.
+    """
+    def __init__(self, controls):
+        self.controls = controls
+        self.frames = bytearray()
+
+    def poll(self):
+        buttons = self.controls.poll()
+        self.frames.append(buttons)
+        return buttons
+
+
+class ReplayInput:
+    def __init__(self, frames):
+        self.frames = frames
+        self.index = 0
+
+    def poll(self):
+        if self.index >= len(self.frames):
+            return 0
+        buttons = self.frames[self.index]
+        self.index += 1
+        return buttons
+
+
+class Replay:
+    """
+     A recorded session: the game seed, the fixed timestep, one button mask per frame
+     and a digest of the final game state used to check that playback is bit-exact.
+    """
+    def __init__(self, seed, dt, frames, digest=0):
+        self.seed = seed
+        self.dt = dt
+        self.frames = bytes(frames)
+        self.digest = digest
+
+    def controls(self):
+        return ReplayInput(self.frames)
+
+    def encode(self):
+        runs = []
+        for buttons in self.frames:
+            if runs and runs[-1][0] == buttons and runs[-1][1] < MAX_RUN:
+                runs[-1][1] += 1
+            else:
+                runs.append([buttons, 1])
+
+        data = bytearray(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.dt, len(self.frames), self.digest))
+        for buttons, length in runs:
+            data += RUN.pack(buttons, length)
+        return bytes(data)
+
+    @classmethod
+    def decode(cls, data):
+        magic, version, seed, dt, frame_count, digest = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError('Not an Asteroid Fury replay or unsupported version')
+
+        frames = bytearray()
+        for buttons, length in RUN.iter_unpack(data[HEADER.size:]):
+            frames += bytes((buttons,)) * length
+        if len(frames) != frame_count:
+            raise ValueError('Replay is truncated')
+        return cls(seed, dt, frames, digest)
+
+    def save(self, filename):
+        with open(filename, 'wb') as file:
+            file.write(self.encode())
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, 'rb') as file:
+            return cls.decode(file.read())
+
+
+def state_digest(game):
+    """
+     CRC32 over the parts of the game state a replay must reproduce exactly.
+    """
+    values = [game.score.current_score, game.health.width, round(game.energy.width * 1000), game.game_clock.get_ticks(),
+              *game.player.rect]
+    for sprite in sorted(game.meteors, key=lambda meteor: tuple(meteor.rect)):
+        values.extend(sprite.rect)
+    for sprite in sorted(game.lasers, key=lambda laser: tuple(laser.rect)):
+        values.extend(sprite.rect)
+    return zlib.crc32(struct.pack(f'<{len(values)}q', *values))
@@ -0,0 +1,25 @@
+class Scene:
+    """
+     A part of the game that is set up and torn down repeatedly. enter() and exit() do nothing when the scene
+     is already in that state; subclasses put their work in on_enter() and on_exit().
+    """
+    def __init__(self):
+        self.active = False
+        self.entered = 0
+
+    def enter(self):
+        if not self.active:
+            self.active = True
+            self.entered += 1
+            self.on_enter()
+
+    def exit(self):
+        if self.active:
+            self.active = False
+            self.on_exit()
+
+    def on_enter(self):
+        pass
+
+    def on_exit(self):
+        pass
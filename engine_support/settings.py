@@ -7,4 +7,11 @@ SPACE_SHIP_HEIGHT, SPACE_SHIP_WIDTH = 135, 135
 LASER_HEIGHT, LASER_WIDTH = 200, 200
 METEOR_HEIGHT, METEOR_WIDTH = 100, 100
 
+FONT_PATH = join('assets', 'images', 'Oxanium-Bold.ttf')
 
+LAYER_STARS = 1
+LAYER_METEORS = 2
+LAYER_PLAYER = 3
+LAYER_LASERS = 4
+LAYER_EXPLOSIONS = 5
+LAYER_HUD = 6
@@ -0,0 +1,130 @@
+import threading
+from collections import namedtuple, deque
+from time import perf_counter, sleep
+
+
+class Snapshot(namedtuple('Snapshot', ('time', 'published', 'sprites', 'score', 'health', 'energy', 'counts'))):
+    """
+     Immutable state after one simulation step: game time, when it was published (perf_counter), the sprites in
+     draw order as (key, image, x, y) tuples, the HUD values and the entity counts for the profiler.
+     The images are shared frames nobody draws on.
+    """
+    __slots__ = ()
+
+
+def interval_stats(times, expected_ms):
+    """
+     Jitter of a series of perf_counter() timestamps: how far each interval strays from expected_ms.
+    """
+    intervals = sorted((later - earlier) * 1000 for earlier, later in zip(times, list(times)[1:]))
+    if not intervals:
+        return {'count': 0, 'mean': 0.0, 'std': 0.0, 'p99': 0.0, 'max_dev': 0.0}
+    mean = sum(intervals) / len(intervals)
+    deviations = sorted(abs(interval - expected_ms) for interval in intervals)
+    return {
+        'count': len(intervals),
+        'mean': mean,
+        'std': (sum((interval - mean) ** 2 for interval in intervals) / len(intervals)) ** 0.5,
+        'p99': deviations[min(len(deviations) - 1, len(deviations) * 99 // 100)],
+        'max_dev': deviations[-1],
+    }
+
+
+def interpolate(previous, current, alpha, max_jump):
+    """
+     Returns (image, (x, y)) for every sprite in current, placed alpha of the way from its position in previous.
+     Sprites that are new, or moved more than max_jump pixels because a pool respawned them, are drawn as they are.
+    """
+    if previous is None or alpha >= 1:
+        return [(image, (x, y)) for _, image, x, y in current.sprites]
+
+    before = {key: (x, y) for key, _, x, y in previous.sprites}
+    placed = []
+    for key, image, x, y in current.sprites:
+        old = before.get(key)
+        if old is not None and abs(x - old[0]) <= max_jump and abs(y - old[1]) <= max_jump:
+            x = old[0] + (x - old[0]) * alpha
+            y = old[1] + (y - old[1]) * alpha
+        placed.append((image, (x, y)))
+    return placed
+
+
+class SnapshotBuffer:
+    """
+     Hands the two latest snapshots from the simulation thread to the renderer. There is one writer, and
+     publish() swaps in the new (previous, current) pair with a single assignment, so readers never see half of one.
+    """
+    def __init__(self):
+        self.pair = (None, None)
+
+    def reset(self):
+        self.pair = (None, None)
+
+    def publish(self, snapshot):
+        self.pair = (self.pair[1], snapshot)
+
+    def latest(self):
+        return self.pair
+
+
+class SimulationThread:
+    """
+     Calls step(dt) at a fixed rate on its own thread and publishes snapshot() after every step.
+     step returns False to stop. When the thread falls more than max_steps behind it drops the lost time
+     rather than running a burst of steps.
+    """
+    def __init__(self, step, snapshot, dt, max_steps=4, window=600):
+        self.step = step
+        self.snapshot = snapshot
+        self.dt = dt
+        self.max_steps = max_steps
+        self.buffer = SnapshotBuffer()
+        self.step_times = deque(maxlen=window)
+        self.thread = None
+        self.running = False
+        self.error = None
+
+    @property
+    def alive(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        if self.alive:
+            return
+        self.running = True
+        self.error = None
+        self.step_times.clear()
+        # Pooled sprites reuse their keys, so the last session's snapshot must not be interpolated from
+        self.buffer.reset()
+        self.buffer.publish(self.snapshot())
+        self.thread = threading.Thread(target=self.run, name='simulation', daemon=True)
+        self.thread.start()
+
+    def run(self):
+        next_step = perf_counter()
+        try:
+            while self.running:
+                now = perf_counter()
+                if now < next_step:
+                    sleep(next_step - now)
+                    continue
+                if now - next_step > self.max_steps * self.dt:
+                    next_step = now
+
+                self.step_times.append(now)
+                if self.step(self.dt) is False:
+                    self.running = False
+                self.buffer.publish(self.snapshot())
+                next_step += self.dt
+        except Exception as error:
+            self.error = error
+            self.running = False
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def stats(self):
+        return interval_stats(self.step_times, self.dt * 1000)
@@ -0,0 +1,136 @@
+import json
+import random
+
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def load_waves(filename):
+    with open(filename, 'r') as file:
+        return json.load(file)['waves']
+
+
+class SpawnStream:
+    """
+     One kind of spawn. Calls spawn() every `interval` ms of game time while count() is below `limit`,
+     shortening the interval by `decay` after each spawn down to `min_interval`.
+     Holds back while the frame load is at or above `hold_at` of the frame budget.
+    """
+    def __init__(self, name, spawn, count):
+        self.name = name
+        self.spawn = spawn
+        self.count = count
+        self.settings = {}
+        self.interval = 0
+        self.elapsed = 0.0
+        self.spawned = 0
+        self.held = 0
+
+    def configure(self, settings, rng):
+        """
+         Applies a wave's settings on top of the previous ones. An interval given as [low, high] is drawn from rng.
+        """
+        self.settings = {**self.settings, **settings}
+        interval = settings.get('interval')
+        if isinstance(interval, list):
+            self.interval = rng.randint(*interval)
+        elif interval is not None:
+            self.interval = interval
+
+    def reset(self):
+        self.settings = {}
+        self.elapsed = 0.0
+        self.spawned = 0
+        self.held = 0
+
+    def update(self, elapsed_ms, load):
+        self.elapsed += elapsed_ms
+        if self.elapsed < self.interval or self.count() >= self.settings.get('limit', 0):
+            return
+        if load >= self.settings.get('hold_at', float('inf')):
+            self.held += 1
+            return
+        if not self.spawn():
+            return
+
+        self.elapsed = 0.0
+        self.spawned += 1
+        self.interval = max(self.settings.get('min_interval', 0), self.interval - self.settings.get('decay', 0))
+
+
+class SpawnScheduler:
+    """
+     Drives spawn streams from game time. Waves are data: each one names the settings of the streams it changes
+     and the game time, in ms, it lasts `until`; the last wave runs forever.
+     record_frame() feeds measured frame work times to the governor, which holds spawns back as they near the budget.
+    """
+    def __init__(self, waves, rng=random, budget_ms=FRAME_BUDGET_MS, smoothing=0.1):
+        self.waves = waves
+        self.rng = rng
+        self.budget_ms = budget_ms
+        self.smoothing = smoothing
+        self.streams = {}
+        self.time = 0.0
+        self.wave_index = 0
+        self.frame_ms = 0.0
+
+    def add_stream(self, name, spawn, count):
+        self.streams[name] = SpawnStream(name, spawn, count)
+        return self.streams[name]
+
+    def reset(self):
+        self.time = 0.0
+        self.frame_ms = 0.0
+        for stream in self.streams.values():
+            stream.reset()
+        self.start_wave(0)
+
+    def start_wave(self, index):
+        self.wave_index = index
+        wave = self.waves[index]
+        for name, stream in self.streams.items():
+            stream.configure(wave.get(name, {}), self.rng)
+
+    def max_limit(self, name):
+        """
+         The largest on-screen limit any wave gives the stream, which is what its entity store has to hold.
+        """
+        return max((wave.get(name, {}).get('limit', 0) for wave in self.waves), default=0)
+
+    @property
+    def wave(self):
+        return self.waves[self.wave_index]['name']
+
+    @property
+    def load(self):
+        return self.frame_ms / self.budget_ms
+
+    def record_frame(self, frame_ms):
+        if self.frame_ms:
+            self.frame_ms += (frame_ms - self.frame_ms) * self.smoothing
+        else:
+            self.frame_ms = frame_ms
+
+    def update(self, dt):
+        elapsed = dt * 1000
+        self.time += elapsed
+        until = self.waves[self.wave_index].get('until')
+        while until is not None and self.time >= until and self.wave_index + 1 < len(self.waves):
+            self.start_wave(self.wave_index + 1)
+            until = self.waves[self.wave_index].get('until')
+
+        load = self.load
+        for stream in self.streams.values():
+            stream.update(elapsed, load)
+
+    def held(self):
+        return sum(stream.held for stream in self.streams.values())
+
+    def stats(self):
+        return {
+            'wave': self.wave,
+            'time': self.time,
+            'load': self.load,
+            **{f'{name}_spawned': stream.spawned for name, stream in self.streams.items()},
+            **{f'{name}_held': stream.held for name, stream in self.streams.items()},
+            **{f'{name}_interval': stream.interval for name, stream in self.streams.items()},
+        }
@@ -1,15 +1,24 @@
 import pygame
 from os.path import join, exists
 from os import walk
+from .manifest import asset_manifest, natural_key
 
-def folder_importer(base_path, *path):
-    surfs = []
+def folder_files(base_path, *path):
+    listed = asset_manifest.folder(join(base_path, *path))
+    if listed is not None:
+        return listed
+
+    files = []
     for folder_path, _, file_names in walk(join(base_path, *path)):
-        for file_name in file_names:
-            full_path = join(folder_path, file_name)
-            image = pygame.image.load(full_path)
-            surfs.append(image)
-    return surfs
+        for file_name in sorted(file_names, key=natural_key):
+            files.append(join(folder_path, file_name))
+    return files
+
+def folder_importer(base_path, *path, loader=pygame.image.load):
+    return [loader(full_path) for full_path in folder_files(base_path, *path)]
+
+def decode_files(paths):
+    return {path: pygame.image.load(asset_manifest.resolve(path)) for path in paths}
 
 def image_transformer(image, width, height):
     scaled_image = pygame.transform.smoothscale(image, (width, height))
@@ -20,8 +29,8 @@ def image_transformer(image, width, height):
 
     return scaled_image
 
-def png_image_cutter(sprite_sheet_path, frame_width, frame_height):
-    sprite_sheet = pygame.image.load(sprite_sheet_path).convert_alpha()
+def png_image_cutter(sprite_sheet_path, frame_width, frame_height, loader=pygame.image.load):
+    sprite_sheet = loader(sprite_sheet_path).convert_alpha()
     sheet_width, sheet_height = sprite_sheet.get_size()
     columns = sheet_width // frame_width
     rows = sheet_height // frame_height
@@ -36,5 +45,15 @@ def png_image_cutter(sprite_sheet_path, frame_width, frame_height):
 
     return frames
 
+def atlas_cutter(pages, rects):
+    images = []
+    masks = []
+    for page, x, y, width, height in rects:
+        image, mask = pages[page]
+        area = pygame.Rect(x, y, width, height)
+        images.append(image.subsurface(area))
+        masks.append(pygame.mask.from_threshold(mask.subsurface(area), (255, 255, 255), (1, 1, 1, 255)))
+    return images, masks
+
 
 
@@ -0,0 +1,43 @@
+import pygame
+from collections import OrderedDict
+from .settings import FONT_PATH
+from .manifest import asset_manifest
+
+
+class TextRenderer:
+    """
+     Loads each font and size once and keeps an LRU cache of rendered strings.
+    """
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size, path=FONT_PATH):
+        key = (path, size)
+        if key not in self.fonts:
+            self.fonts[key] = pygame.font.Font(asset_manifest.resolve(path) if path else path, size)
+        return self.fonts[key]
+
+    def render(self, text, size, color, path=FONT_PATH, antialias=True):
+        key = (text, size, color, path, antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(size, path).render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'fonts': len(self.fonts), 'entries': len(self.surfaces)}
+
+
+text_renderer = TextRenderer()
@@ -1,32 +1,107 @@
 import pygame
-from engine_support import png_image_cutter, join, image_transformer
+from engine_support import asset_cache, Poolable, SpritePool, LAYER_EXPLOSIONS
 
-class AnimatedExplosion(pygame.sprite.Sprite):
-    preloaded_frames = None
+EXPLOSION_SHEETS = (
+    (('assets', 'images', 'explosions', '1.png'), (196, 190)),
+    (('assets', 'images', 'explosions', '2.png'), (205, 195)),
+    (('assets', 'images', 'explosions', '3.png'), (192, 193)),
+)
+EXPLOSION_SHEET, EXPLOSION_FRAME = EXPLOSION_SHEETS[0]
+EXPLOSION_SIZE = (150, 150)
+EXPLOSION_SCALES = {
+    'normal': EXPLOSION_SIZE,
+    'large': (200, 200),
+}
 
-    def __init__(self, pos, groups):
-        super().__init__(groups)
 
-        if AnimatedExplosion.preloaded_frames is None:
-            original_frames = png_image_cutter(join('assets', 'images', 'explosions', '1.png'), 196, 190)
-            AnimatedExplosion.preloaded_frames = [image_transformer(frame, 150, 150) for frame in original_frames]
+class ExplosionEffects:
+    """
+     Frames of every explosion sheet at every scale, built once during loading and shared by all explosions.
+     A variant is a (sheet index, scale name) pair. Every frame of a variant has the same size.
+    """
+    def __init__(self, sheets=EXPLOSION_SHEETS, scales=EXPLOSION_SCALES):
+        self.sheets = sheets
+        self.scales = scales
+        self.variants = {}
+        self.next_sheet = 0
 
-        self.frames = AnimatedExplosion.preloaded_frames
+    def keys(self):
+        return [(sheet, scale) for sheet in range(len(self.sheets)) for scale in self.scales]
+
+    def prefetch(self, worker):
+        for path, frame in self.sheets:
+            for size in self.scales.values():
+                asset_cache.prefetch(worker, 'sheet', path, *frame, size)
+
+    def reset(self):
+        self.next_sheet = 0
+
+    def load(self):
+        for key in self.keys():
+            self.variant(*key)
+
+    def variant(self, sheet=0, scale='normal'):
+        key = (sheet, scale)
+        if key not in self.variants:
+            path, frame = self.sheets[sheet]
+            self.variants[key] = tuple(asset_cache.sheet(path, *frame, self.scales[scale]).images)
+        return self.variants[key]
+
+    def pick(self, scale='normal'):
+        """
+         Takes the sheets in turn so explosions next to each other look different.
+         Leaves the game's random generator alone, so seeded runs and replays are unchanged.
+        """
+        sheet = self.next_sheet
+        self.next_sheet = (sheet + 1) % len(self.sheets)
+        return self.variant(sheet, scale)
+
+
+explosion_effects = ExplosionEffects()
+
+
+class AnimatedExplosion(Poolable, pygame.sprite.Sprite):
+    _layer = LAYER_EXPLOSIONS
+
+    # The first sheet at the normal scale, as always. Subclasses opt into other variants; sheet = None
+    # takes the sheets in turn.
+    sheet = 0
+    scale = 'normal'
+    animation_fps = 30
+
+    def __init__(self, pos, groups, clock):
+        super().__init__()
+
+        self.rect = pygame.Rect((0, 0), explosion_effects.scales[self.scale])
+        self.spawn(pos, groups, clock)
+
+    @staticmethod
+    def prefetch(worker):
+        explosion_effects.prefetch(worker)
+
+    def spawn(self, pos, groups, clock):
+        self.add(groups)
+        if self.sheet is None:
+            self.frames = explosion_effects.pick(self.scale)
+        else:
+            self.frames = explosion_effects.variant(self.sheet, self.scale)
         self.image = self.frames[0]
-        self.rect = self.image.get_rect(center=pos)
-        self.frame_index = 0
-        self.animation_speed = 0.5
+        self.rect.center = pos
+        self.animation = clock.animation(len(self.frames), self.animation_fps, loop=False)
+
+    def retire(self):
+        self.animation = None
 
     def update(self, dt):
-        self.frame_index += self.animation_speed
-        if self.frame_index >= len(self.frames):
+        frame = int(self.animation.position)
+        if frame >= len(self.frames):
             self.kill()
         else:
-            self.image = self.frames[int(self.frame_index)]
-            self.rect = self.image.get_rect(center=self.rect.center)
+            self.image = self.frames[frame]
 
 class PlayerExplosion(AnimatedExplosion):
-    def __init__(self, pos, groups):
-        super().__init__(pos, groups)
-        self.frames = AnimatedExplosion.preloaded_frames
+    pass
+
 
+explosion_pool = SpritePool(AnimatedExplosion, capacity=32)
+player_explosion_pool = SpritePool(PlayerExplosion, capacity=8)
@@ -1,24 +1,43 @@
 import pygame 
-from os.path import join
-from engine_support import LASER_HEIGHT, LASER_WIDTH, image_transformer
+from engine_support import LASER_HEIGHT, LASER_WIDTH, asset_cache, Poolable, SpritePool, LAYER_LASERS
+
+LASER_IMAGE = ('assets', 'images', 'laser', 'Laser.png')
+LASER_ANGLE = 121
+
+class Laser(Poolable, pygame.sprite.Sprite):
+    _layer = LAYER_LASERS
 
-class Laser(pygame.sprite.Sprite):
     def __init__(self, sprite_groups, player):
-        super().__init__(sprite_groups)
-        self.groups = sprite_groups
-        self.player = player
-        self.initial_image = pygame.image.load(join('assets', 'images', 'laser', 'Laser.png')).convert_alpha()
-        self.angle = 121
-        self.rotated_image = pygame.transform.rotate(self.initial_image, self.angle)
-        self.image = image_transformer(self.rotated_image, LASER_WIDTH, LASER_HEIGHT)
-        self.mask = pygame.mask.from_surface(self.image)
+        super().__init__()
+        self.angle = LASER_ANGLE
+        frames = asset_cache.image(LASER_IMAGE, (LASER_WIDTH, LASER_HEIGHT), angle=self.angle)
+        self.image = frames.images[0]
+        self.mask = frames.masks[0]
+        self.hit_shape = frames.hit_shape(0)
 
         self.offset_x = -6  
         self.offset_y = -30  
 
         self.rect = self.image.get_rect()
+        self.spawn(sprite_groups, player)
+
+    @staticmethod
+    def prefetch(worker):
+        asset_cache.prefetch(worker, 'image', LASER_IMAGE, (LASER_WIDTH, LASER_HEIGHT), angle=LASER_ANGLE)
+
+    @property
+    def hitbox(self):
+        return self.hit_shape.rect(self.rect)
+
+    def spawn(self, sprite_groups, player):
+        self.add(sprite_groups)
+        self.groups = sprite_groups
+        self.player = player
         self.rect.midbottom = (self.player.rect.centerx + self.offset_x, self.player.rect.centery + self.offset_y)
 
+    def retire(self):
+        self.player = None
+
     def update(self, dt):
         """
          Updates the position of the laser and destroys it if it moves off-screen.
@@ -26,3 +45,6 @@ class Laser(pygame.sprite.Sprite):
         self.rect.centery -= 400 * dt
         if self.rect.bottom < 0:
             self.kill()
+
+
+laser_pool = SpritePool(Laser, capacity=128)
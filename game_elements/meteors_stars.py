@@ -1,57 +1,88 @@
 import pygame
-from engine_support import METEOR_WIDTH, METEOR_HEIGHT, image_transformer, join, folder_importer,WINDOW_WIDTH, WINDOW_HEIGHT
+from engine_support import METEOR_WIDTH, METEOR_HEIGHT, WINDOW_WIDTH, WINDOW_HEIGHT, asset_cache, Poolable, SpritePool, \
+    LAYER_METEORS, LAYER_STARS, EntityStore
 import random 
-from random import randint
 
-class Meteor(pygame.sprite.Sprite):
-    def __init__(self, sprite_group, meteors):
-        super().__init__(sprite_group)
+STAR_IMAGE = ('assets', 'images', 'star.png')
+STAR_SIZE = (100, 100)
+STAR_ANGLE = 303
+METEOR_FOLDER = ('assets', 'images', 'meteor')
+METEOR_SIZE = (METEOR_HEIGHT, METEOR_WIDTH)
+
+class Meteor(Poolable, pygame.sprite.Sprite):
+    _layer = LAYER_METEORS
+
+    animation_fps = 16.2
+
+    def __init__(self, sprite_group, meteors, store, rng=random):
+        super().__init__()
+        frames = asset_cache.folder(METEOR_FOLDER, METEOR_SIZE)
+        self.meteor_frames = frames.images
+        self.meteor_masks = frames.masks
+        self.spawn(sprite_group, meteors, store, rng)
+
+    @classmethod
+    def create_store(cls, capacity):
+        frames = asset_cache.folder(METEOR_FOLDER, METEOR_SIZE)
+        return EntityStore(capacity, frames.images, frames.masks, cls.animation_fps, METEOR_HEIGHT / 2, WINDOW_HEIGHT)
+
+    @staticmethod
+    def prefetch(worker):
+        asset_cache.prefetch(worker, 'folder', METEOR_FOLDER, METEOR_SIZE)
+
+    def spawn(self, sprite_group, meteors, store, rng=random):
+        self.add(sprite_group)
         self.meteors = meteors
         self.groups = sprite_group
-
-        self.meteor_frames = [image_transformer(image, METEOR_HEIGHT, METEOR_WIDTH) for image in folder_importer('assets', 'images', 'meteor')]
+        self.store = store
 
         self.image = self.meteor_frames[0]
-        self.rect = self.image.get_rect(midbottom=(randint(50, WINDOW_WIDTH - 50), 0))
-        self.mask = pygame.mask.from_surface(self.image)
-
-        self.frame_index = 0
-        self.animation_speed = 0.27
+        self.rect = self.image.get_rect(midbottom=(rng.randint(50, WINDOW_WIDTH - 50), 0))
+        self.mask = self.meteor_masks[0]
 
-        self.direction = pygame.Vector2(random.uniform(-1, 1), 1)
-        self.direction.x *= random.uniform(0.5, 1.0)
-        self.speed = random.uniform(150, 300)
+        self.direction = pygame.Vector2(rng.uniform(-1, 1), 1)
+        self.direction.x *= rng.uniform(0.5, 1.0)
+        self.speed = rng.uniform(150, 300)
         self.velocity = self.direction * self.speed
+        self.slot = store.add(self, *self.rect.center, *self.velocity)
 
     def update(self, dt):
-        self.frame_index += self.animation_speed
-        if self.frame_index >= len(self.meteor_frames):
-            self.frame_index = 0
+        """
+         Motion, animation and culling run in batch in the meteor EntityStore.
+        """
 
-        self.image = self.meteor_frames[int(self.frame_index)]
-
-        self.rect.center += self.velocity * dt
-
-        if self.rect.top > WINDOW_HEIGHT:
-            self.kill()
+    def kill(self):
+        self.store.remove(self.slot, self)
+        super().kill()
 
 class Stars(pygame.sprite.Sprite):
-    star_image = None
+    _layer = LAYER_STARS
 
-    def __init__(self, groups):
+    def __init__(self, groups, store, rng=random):
         super().__init__(groups)
-        
-        if Stars.star_image is None:
-            initial_image = pygame.image.load(join('assets', 'images', 'star.png')).convert_alpha()
-            rotated_image = pygame.transform.rotate(initial_image, 303)
-            Stars.star_image = pygame.transform.scale(rotated_image, (100, 100))
-
-        self.image = Stars.star_image
-        self.rect = self.image.get_rect(center=(randint(0, 1280), -10))
+
+        self.image = asset_cache.image(STAR_IMAGE, STAR_SIZE, angle=STAR_ANGLE, smooth=False)[0]
+        self.rect = self.image.get_rect(center=(rng.randint(0, 1280), -10))
         self.speed = 1
+        self.store = store
+        self.slot = store.add(self, *self.rect.center, 0, 400 * self.speed)
+
+    @staticmethod
+    def create_store(capacity):
+        return EntityStore(capacity, half_height=STAR_SIZE[1] / 2, cull_y=WINDOW_HEIGHT)
+
+    @staticmethod
+    def prefetch(worker):
+        asset_cache.prefetch(worker, 'image', STAR_IMAGE, STAR_SIZE, angle=STAR_ANGLE, smooth=False)
 
     def update(self, dt):
-        self.rect.centery += 400 * self.speed * dt
-        if self.rect.top > pygame.display.get_surface().get_height():
-            self.kill()
+        """
+         Motion and culling run in batch in the star EntityStore.
+        """
+
+    def kill(self):
+        self.store.remove(self.slot, self)
+        super().kill()
+
 
+meteor_pool = SpritePool(Meteor, capacity=64)
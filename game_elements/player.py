@@ -1,8 +1,13 @@
 import pygame
-from engine_support import SPACE_SHIP_HEIGHT, SPACE_SHIP_WIDTH, WINDOW_HEIGHT, WINDOW_WIDTH, laser_sound, join, folder_importer, image_transformer
-from game_elements import Laser
+from engine_support import SPACE_SHIP_HEIGHT, SPACE_SHIP_WIDTH, WINDOW_HEIGHT, WINDOW_WIDTH, laser_sound, asset_cache,\
+    real_clock, KeyboardInput, LEFT, RIGHT, UP, DOWN, SHOOT, LAYER_PLAYER, audio_manager
+from game_elements import laser_pool
 from abc import ABC, abstractmethod
 
+SHIP_CENTER = ('assets', 'images', 'space_ship', 'red', 'center.png')
+SHIP_LEFT = ('assets', 'images', 'space_ship', 'red', 'Left')
+SHIP_RIGHT = ('assets', 'images', 'space_ship', 'red', 'Right')
+
 
 class SpaceEntity(pygame.sprite.Sprite, ABC):
     def __init__(self, sprite_groups, health, energy):
@@ -37,84 +42,121 @@ class Movable:
 
 
 class Shooter:
-    def __init__(self):
+    cooldown = 400
+
+    def __init__(self, clock=real_clock):
+        self.clock = clock
         self.can_shoot = True
         self.laser_shoot_time = 0
-        self.cooldown_duration = 400
-        self.laser_sound = pygame.mixer.Sound(laser_sound)
-        self.laser_sound.set_volume(0.2)
+        self.cooldown_duration = self.cooldown
+        audio_manager.register('laser', laser_sound, volume=0.2, voices=3, priority=0)
 
+    def reset_shooter(self):
+        self.can_shoot = True
+        self.laser_shoot_time = 0
+        self.cooldown_duration = self.cooldown
 
     def laser_timer(self):
         if not self.can_shoot:
-            current_time = pygame.time.get_ticks()
+            current_time = self.clock.get_ticks()
             if current_time - self.laser_shoot_time >= self.cooldown_duration:
                 self.can_shoot = True
 
     def shoot(self, groups, lasers_group, player):
         if self.can_shoot:
-            laser = Laser(groups, player)
-            lasers_group.add(laser)
-            self.laser_sound.play()
+            laser = laser_pool.acquire(groups, player)
+            if laser is not None:
+                lasers_group.add(laser)
+                audio_manager.play('laser')
             self.can_shoot = False
-            self.laser_shoot_time = pygame.time.get_ticks()
+            self.laser_shoot_time = self.clock.get_ticks()
 
 
 class Player(SpaceEntity, Movable, Shooter):
-    def __init__(self, sprite_groups, lasers_group, health, energy):
+    _layer = LAYER_PLAYER
+
+    special_cost = 7
+    special_threshold = 50
+    bank_fps = 60
+
+    def __init__(self, sprite_groups, lasers_group, health, energy, controls=None, clock=real_clock):
         SpaceEntity.__init__(self, sprite_groups, health, energy)
-        Shooter.__init__(self)  
+        Shooter.__init__(self, clock)  
         self.groups = sprite_groups
         self.lasers = lasers_group
+        self.controls = controls if controls is not None else KeyboardInput()
 
-        self.center_frame = pygame.image.load(join('assets', 'images', 'space_ship', 'red', 'center.png'))
-        self.left_frames = folder_importer('assets', 'images', 'space_ship', 'red', 'Left')
-        self.right_frames = folder_importer('assets', 'images', 'space_ship', 'red', 'Right')
-        self.image = image_transformer(self.center_frame, SPACE_SHIP_WIDTH, SPACE_SHIP_HEIGHT)
+        self.animations = self.load_animations()
+        self.center_frame = self.animations['center']
+        self.left_frames = self.animations['left']
+        self.right_frames = self.animations['right']
+        self.image = self.center_frame.images[0]
         self.rect = self.image.get_rect(midbottom=(WINDOW_WIDTH / 2, 700))
-        self.mask = pygame.mask.from_surface(self.image)
-
-        self.frame_index_left = 0
-        self.frame_index_right = 0
+        self.mask = self.center_frame.masks[0]
+        self.banking = clock.animation(len(self.right_frames), self.bank_fps, loop=False)
+
+    def reset(self):
+        """
+         Puts the ship back on its launch spot for a new round.
+        """
+        self.reset_shooter()
+        self.direction = pygame.Vector2(0, 0)
+        self.set_frame(self.center_frame, 0)
+        self.rect = self.image.get_rect(midbottom=(WINDOW_WIDTH / 2, 700))
+        self.banking.restart()
 
     def update(self, dt):
-        keys = pygame.key.get_pressed()
-        new_direction = pygame.Vector2(int(keys[pygame.K_RIGHT]) - int(keys[pygame.K_LEFT]),
-                                       int(keys[pygame.K_DOWN]) - int(keys[pygame.K_UP]))
+        buttons = self.controls.poll()
+        new_direction = pygame.Vector2(bool(buttons & RIGHT) - bool(buttons & LEFT),
+                                       bool(buttons & DOWN) - bool(buttons & UP))
 
         if new_direction != self.direction:
             self.direction = new_direction
-            self.frame_index_left = 0
-            self.frame_index_right = 0
+            self.banking.restart()
 
         self.update_image()
         self.update_position(self.rect, self.direction, self.speed, dt)
 
-        if keys[pygame.K_SPACE] and self.can_shoot:
+        if buttons & SHOOT and self.can_shoot:
             if self.energy.width == 0:
                 self.can_shoot = False
             else:
                 self.shoot(self.groups, self.lasers, self)
                 self.special_move()
 
-        self.energy.increase(3.5)
         self.laser_timer()
 
+    @staticmethod
+    def load_animations():
+        """
+         Builds the banking table: a scaled surface and its mask for every frame of every state.
+        """
+        size = (SPACE_SHIP_WIDTH, SPACE_SHIP_HEIGHT)
+        return {
+            'center': asset_cache.image(SHIP_CENTER, size),
+            'left': asset_cache.folder(SHIP_LEFT, size),
+            'right': asset_cache.folder(SHIP_RIGHT, size),
+        }
+
+    @staticmethod
+    def prefetch(worker):
+        size = (SPACE_SHIP_WIDTH, SPACE_SHIP_HEIGHT)
+        asset_cache.prefetch(worker, 'image', SHIP_CENTER, size)
+        asset_cache.prefetch(worker, 'folder', SHIP_LEFT, size)
+        asset_cache.prefetch(worker, 'folder', SHIP_RIGHT, size)
+
+    def set_frame(self, frames, index):
+        self.image = frames.images[index]
+        self.mask = frames.masks[index]
+
     def update_image(self):
         if self.direction.x > 0:
-            self.image = image_transformer(self.right_frames[self.frame_index_right], SPACE_SHIP_WIDTH,
-                                           SPACE_SHIP_HEIGHT)
-            self.frame_index_right = min(self.frame_index_right + 1, len(self.right_frames) - 1)
-            self.frame_index_left = 0
+            self.set_frame(self.right_frames, self.banking.frame)
         elif self.direction.x < 0:
-            self.image = image_transformer(self.left_frames[self.frame_index_left], SPACE_SHIP_WIDTH, SPACE_SHIP_HEIGHT)
-            self.frame_index_left = min(self.frame_index_left + 1, len(self.left_frames) - 1)
-            self.frame_index_right = 0
+            self.set_frame(self.left_frames, self.banking.frame)
         else:
-            self.image = image_transformer(self.center_frame, SPACE_SHIP_WIDTH, SPACE_SHIP_HEIGHT)
-            self.frame_index_left = 0
-            self.frame_index_right = 0
+            self.set_frame(self.center_frame, 0)
 
     def special_move(self):
-        self.reduce_energy(7)
-        self.cooldown_duration = 0 if self.energy.width > 50 else 400
+        self.reduce_energy(self.special_cost)
+        self.cooldown_duration = 0 if self.energy.width > self.special_threshold else self.cooldown
@@ -1,26 +1,45 @@
 from os.path import exists
 import json
+from .score_store import ScoreStore
+
+TOP_SCORES = 10
 
 class HighScoresManager:
-    def __init__(self, filename='high_score_resources/high_scores.json'):
+    def __init__(self, filename='high_score_resources/high_scores.db',
+                 legacy_filename='high_score_resources/high_scores.json'):
         self.filename = filename
+        self.legacy_filename = legacy_filename
         self.score = 0
+        self.store = ScoreStore(filename)
+        self.import_legacy_scores()
         self.high_scores = self.load_high_scores()
 
-    def load_high_scores(self):
-        if exists(self.filename):
-            with open(self.filename, 'r') as file:
-                return json.load(file)
-        return []
+    def import_legacy_scores(self):
+        if self.store.count() == 0 and self.legacy_filename and exists(self.legacy_filename):
+            with open(self.legacy_filename, 'r') as file:
+                self.store.add_many((entry['name'], entry['score']) for entry in json.load(file))
 
-    def save_high_scores(self):
-        with open(self.filename, 'w') as file:
-            json.dump(self.high_scores, file, indent=4)
+    def load_high_scores(self):
+        return self.store.top(TOP_SCORES)
 
     def add_high_score(self, name, score):
-        self.high_scores.append({'name': name, 'score': score})
-        self.high_scores = sorted(self.high_scores, key=lambda x: x['score'], reverse=True)[:10]
-        self.save_high_scores()
+        """
+         Queues the score for the background writer and updates the cached top list right away.
+        """
+        row = self.store.add(name, score)
+        self.high_scores.append({'name': name, 'score': score, 'day': row[3]})
+        self.high_scores = sorted(self.high_scores, key=lambda x: x['score'], reverse=True)[:TOP_SCORES]
+
+    def get_high_scores(self, limit=TOP_SCORES, offset=0, name=None, day=None):
+        if limit == TOP_SCORES and offset == 0 and name is None and day is None:
+            return self.high_scores
+        return self.store.top(limit, offset, name, day)
+
+    def page(self, limit=TOP_SCORES, after=None, before=None, last=False, name=None, day=None):
+        return self.store.page(limit, after, before, last, name, day)
+
+    def count(self, name=None, day=None):
+        return self.store.count(name, day)
 
-    def get_high_scores(self):
-        return self.high_scores
+    def close(self):
+        self.store.close()
@@ -1,22 +1,29 @@
-from os.path import join
 import pygame
+from engine_support import LAYER_HUD, text_renderer
 
 class Scoreboard(pygame.sprite.Sprite):
+    _layer = LAYER_HUD
+
     def __init__(self, groups):
         super().__init__(groups)
         self.groups = groups
         self.current_score = 0
-        font = pygame.font.Font(join('assets', 'images', 'Oxanium-Bold.ttf'), 40)  # Font style and size
-        self.image = font.render(str(self.current_score), True, (255, 255, 240))
-        self.rect = self.image.get_rect(center=(170, 620))
+        self.rendered_score = None
+        self.update_image()
+
+    def reset(self):
+        self.current_score = 0
+        self.update_image()
 
     def update_image(self):
-        font = pygame.font.Font(join('assets', 'images', 'Oxanium-Bold.ttf'), 40)
-        self.image = font.render(f'Score: {self.current_score}', True, (255, 255, 240))
+        if self.current_score == self.rendered_score:
+            return
+        self.image = text_renderer.render(f'Score: {self.current_score}', 40, (255, 255, 240))
         self.rect = self.image.get_rect(center=(170, 620))
+        self.rendered_score = self.current_score
 
     def update(self, *args):
         self.update_image()
 
     def increase_score(self):
-        self.current_score += 1
\ No newline at end of file
+        self.current_score += 1
@@ -0,0 +1,178 @@
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import date
+
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS scores ('
+    'id INTEGER PRIMARY KEY, name TEXT NOT NULL, score INTEGER NOT NULL, day TEXT NOT NULL, created REAL NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id)',
+    'CREATE INDEX IF NOT EXISTS scores_by_name ON scores (name, score DESC, id)',
+    'CREATE INDEX IF NOT EXISTS scores_by_day ON scores (day, score DESC, id)',
+)
+INSERT = 'INSERT INTO scores (id, name, score, day, created) VALUES (?, ?, ?, ?, ?)'
+
+
+class ScoreStore:
+    """
+     SQLite score table with indexes for top-N queries overall, per player and per day.
+     Inserts are queued and committed in batches by a background thread, each batch in one transaction.
+     Queued rows stay in memory until committed and are merged into query results, so reads never wait on the writer.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        with self.connection:
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+        self.next_id = self.connection.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM scores').fetchone()[0]
+
+        self.unwritten = deque()
+        self.lock = threading.Lock()
+        self.pending = queue.Queue()
+        self.writer = threading.Thread(target=self.write_loop, name='score-writer', daemon=True)
+        self.writer.start()
+        atexit.register(self.close)
+
+    def write_loop(self):
+        connection = sqlite3.connect(self.filename)
+        while True:
+            rows = [self.pending.get()]
+            while True:
+                try:
+                    rows.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in rows
+            rows = [row for row in rows if row is not None]
+            if rows:
+                with connection:
+                    connection.executemany(INSERT, rows)
+                with self.lock:
+                    for _ in rows:
+                        self.unwritten.popleft()
+            for _ in range(len(rows) + stop):
+                self.pending.task_done()
+            if stop:
+                connection.close()
+                return
+
+    def row(self, name, score, created=None):
+        """
+         Ids are handed out here rather than by SQLite, so a queued row has its id before it is written.
+        """
+        created = time.time() if created is None else created
+        row_id = self.next_id
+        self.next_id += 1
+        return row_id, name, score, date.fromtimestamp(created).isoformat(), created
+
+    def add(self, name, score, created=None):
+        row = self.row(name, score, created)
+        with self.lock:
+            self.unwritten.append(row)
+        self.pending.put(row)
+        return row
+
+    def add_many(self, entries):
+        """
+         Inserts (name, score) pairs synchronously in a single transaction, after any queued rows.
+        """
+        self.flush()
+        with self.connection:
+            self.connection.executemany(INSERT, [self.row(name, score) for name, score in entries])
+
+    def flush(self):
+        self.pending.join()
+
+    def queued(self, name, day):
+        """
+         The rows still waiting for the writer that match the filters, and the id they start from. Every row
+         with a lower id has been committed, so queries read the table below that id and add these rows.
+        """
+        with self.lock:
+            rows = list(self.unwritten)
+        if not rows:
+            return [], None
+        matching = [{'id': row_id, 'name': row_name, 'score': score, 'day': row_day}
+                    for row_id, row_name, score, row_day, _ in rows
+                    if (name is None or row_name == name) and (day is None or row_day == day)]
+        return matching, rows[0][0]
+
+    @staticmethod
+    def filters(name, day, below=None):
+        clauses = []
+        params = []
+        if name is not None:
+            clauses.append('name = ?')
+            params.append(name)
+        if day is not None:
+            clauses.append('day = ?')
+            params.append(day)
+        if below is not None:
+            clauses.append('id < ?')
+            params.append(below)
+        return (f" WHERE {' AND '.join(clauses)}" if clauses else ''), params
+
+    @staticmethod
+    def ranked(entries):
+        return sorted(entries, key=lambda entry: (-entry['score'], entry['id']))
+
+    def top(self, limit=10, offset=0, name=None, day=None):
+        queued, below = self.queued(name, day)
+        where, params = self.filters(name, day, below)
+        skip = 0 if queued else offset
+        cursor = self.connection.execute(
+            f'SELECT id, name, score, day FROM scores{where} ORDER BY score DESC, id LIMIT ? OFFSET ?',
+            (*params, limit + offset - skip, skip))
+        rows = [{'id': row_id, 'name': name, 'score': score, 'day': day} for row_id, name, score, day in cursor]
+        if queued:
+            rows = self.ranked(rows + queued)[offset:offset + limit]
+        return [{'name': row['name'], 'score': row['score'], 'day': row['day']} for row in rows]
+
+    def page(self, limit=10, after=None, before=None, last=False, name=None, day=None):
+        """
+         Keyset pagination in leaderboard order (score DESC, id). after and before are the (score, id) of the row
+         just outside the wanted page, and last asks for the final page. Each page walks the index from its
+         first row, so deep pages cost the same as the first one, unlike OFFSET.
+        """
+        queued, below = self.queued(name, day)
+        where, params = self.filters(name, day, below)
+        clauses = [where[len(' WHERE '):]] if where else []
+        order = 'score DESC, id'
+        if after is not None:
+            clauses.append('score <= ? AND (score < ? OR id > ?)')
+            params += [after[0], after[0], after[1]]
+            queued = [row for row in queued if (row['score'], -row['id']) < (after[0], -after[1])]
+        elif before is not None:
+            clauses.append('score >= ? AND (score > ? OR id < ?)')
+            params += [before[0], before[0], before[1]]
+            queued = [row for row in queued if (row['score'], -row['id']) > (before[0], -before[1])]
+        backwards = before is not None or last
+        if backwards:
+            order = 'score, id DESC'
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+        cursor = self.connection.execute(
+            f'SELECT id, name, score, day FROM scores{where} ORDER BY {order} LIMIT ?', (*params, limit))
+        rows = [{'id': row_id, 'name': name, 'score': score, 'day': day} for row_id, name, score, day in cursor]
+        if queued:
+            rows = self.ranked(rows + queued)
+            return rows[-limit:] if backwards else rows[:limit]
+        return rows[::-1] if backwards else rows
+
+    def count(self, name=None, day=None):
+        queued, below = self.queued(name, day)
+        where, params = self.filters(name, day, below)
+        return self.connection.execute(f'SELECT COUNT(*) FROM scores{where}', params).fetchone()[0] + len(queued)
+
+    def close(self):
+        atexit.unregister(self.close)
+        if self.writer.is_alive():
+            self.pending.put(None)
+            self.writer.join()
+        self.connection.close()
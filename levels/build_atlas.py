@@ -0,0 +1,30 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from engine_support import asset_cache, build_atlas, write_manifest, ATLAS_INDEX, MANIFEST_PATH
+from game_elements import explosion_effects
+from levels.main import Game
+
+
+def main():
+    """
+     Loads every frame set the game asks for, at the sizes in settings.py, from the source PNGs and packs them.
+    """
+    asset_cache.atlas = None
+    asset_cache.clear()
+    game = Game(headless=True)
+    explosion_effects.load()
+    game.close()
+
+    index = build_atlas(asset_cache.entries)
+    frames = sum(len(rects) for rects in index['entries'].values())
+    print(f"wrote {ATLAS_INDEX}: {frames} frames from {len(index['entries'])} sets on {len(index['pages'])} page(s)")
+
+    manifest = write_manifest()
+    print(f"wrote {MANIFEST_PATH}: {len(manifest['files'])} files")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import argparse
+import os
+from time import perf_counter
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from engine_support import RandomInput, ScriptedInput
+from levels.main import Game, FIXED_DT
+
+
+def run_headless(frames, seed=0, dt=FIXED_DT, render=False, controls=None, trace_path=None):
+    game = Game(headless=True, controls=controls if controls is not None else RandomInput(seed), seed=seed,
+                trace_path=trace_path)
+
+    start = perf_counter()
+    simulated = game.simulate(frames, dt, render)
+    elapsed = perf_counter() - start
+    game.close()
+
+    return {
+        'score': game.score.current_score,
+        'frames': simulated,
+        'alive': game.health.width > 0,
+        'seconds': elapsed,
+        'ms_per_frame': elapsed / simulated * 1000 if simulated else 0.0,
+        'fps': simulated / elapsed if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run Asteroid Fury without a window at a fixed timestep.')
+    parser.add_argument('--frames', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dt', type=float, default=FIXED_DT)
+    parser.add_argument('--render', action='store_true', help='draw every frame to the off-screen surface')
+    parser.add_argument('--idle', action='store_true', help='press nothing instead of using the random pilot')
+    parser.add_argument('--trace', help='profile every frame and write the trace to this .csv or .json file')
+    args = parser.parse_args()
+
+    controls = ScriptedInput([0]) if args.idle else None
+    result = run_headless(args.frames, args.seed, args.dt, args.render, controls, args.trace)
+    for key, value in result.items():
+        print(f'{key}: {value:.3f}' if isinstance(value, float) else f'{key}: {value}')
+
+
+if __name__ == '__main__':
+    main()
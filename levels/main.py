@@ -1,224 +1,530 @@
+import os
 import pygame
 import random
 from os.path import join
-from game_elements import Meteor, Stars, PlayerExplosion, AnimatedExplosion, Player
-from engine_support import sound_main_music, sound_explosion
+from collections import deque
+from time import perf_counter
+from game_elements import Meteor, Stars, Player, Laser, AnimatedExplosion, meteor_pool, laser_pool, explosion_pool, \
+    player_explosion_pool, explosion_effects
+from engine_support import sound_main_music, sound_explosion, SpatialHash, WINDOW_WIDTH, WINDOW_HEIGHT, \
+    SimulationClock, FrameProfiler, PHASES, STEP_PHASES, asset_cache, asset_manifest, text_renderer, collide_hitbox, \
+    io_worker, LoadingStage, SpawnScheduler, load_waves, audio_manager, SimulationThread, Snapshot, interpolate, \
+    interval_stats, Background, KeyboardInput, LatchedInput
 from ui import *
-from high_score_resources import HighScoresManager, Scoreboard
+from high_score_resources import HighScoresManager
+from levels.round import Round
 
-
-pygame.mixer.init()
-
-SPAWN_INTERVAL_STARS = 500
-MIN_SPAWN_INTERVAL = 150
-SPAWN_DECREASE_RATE = 5
-MAX_METEORS = 30
-MAX_STARS = 20
+WAVES_PATH = join('levels', 'waves.json')
 BUTTON_WIDTH = 400
 BUTTON_HEIGHT = 50
 DEFAULT_BOX_COLOR = '#8e7cc3'
 BUTTON_TEXT_COLOR = (255, 255, 255)
-FONT_PATH = join('assets', 'images', 'Oxanium-Bold.ttf')
 BG_COLOR = (0, 0, 0)
-FAQ_BG_COLOR = '#adadff'
 FONT_SIZE = 40
+COLLISION_CELL_SIZE = 128
+FIXED_DT = 1 / 60
+FRAME_RATE = 60
+MAX_LOGIC_STEPS = 4
+MAX_INTERPOLATION = 64
+FULL_RENDER = 'full'
+DIRTY_RENDER = 'dirty'
+MENU_IDLE_TIMEOUT = 500
+LOADING_BUDGET_MS = 8
+BACKGROUND_IMAGE = join('assets', 'images', 'bg', '1349322.png')
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, controls=None, seed=None, fixed_dt=None, profile=False, trace_path=None,
+                 render_mode=FULL_RENDER, waves=None, high_scores=None, logic_hz=None, fps=FRAME_RATE, threaded=False):
+        self.headless = headless
+        self.threaded = threaded
+        self.render_mode = FULL_RENDER if threaded else render_mode
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.fixed_dt = FIXED_DT if headless and fixed_dt is None else fixed_dt
+        self.logic_dt = 1 / logic_hz if logic_hz else None
+        self.logic_time = 0.0
+        self.fps = fps
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+        pygame.mixer.init()
         pygame.init()
         self.display_surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption('Asteroid Fury')
         self.clock = pygame.time.Clock()
+        self.game_clock = SimulationClock()
+        if threaded:
+            # The keyboard is read on this thread every frame; the simulation thread only sees the latched mask
+            controls = LatchedInput(controls if controls is not None else KeyboardInput())
+        self.controls = controls
+        profiling = profile or trace_path is not None
+        if threaded:
+            # Steps run on the simulation thread and are timed on a profiler of their own
+            self.profiler = FrameProfiler(profiling, record_trace=trace_path is not None,
+                                          phases=tuple(name for name in PHASES if name not in STEP_PHASES))
+            self.step_profiler = FrameProfiler(profiling, phases=STEP_PHASES)
+        else:
+            self.profiler = self.step_profiler = FrameProfiler(profiling, record_trace=trace_path is not None)
+        self.trace_path = trace_path
+        self.allocations = self.allocation_count()
         self.running = True
         self.current_state = GameState.MAIN_MENU
+        self.needs_redraw = True
+        self.player_name = ''
 
-        self.collision_sound = pygame.mixer.Sound(sound_explosion)  
-        self.collision_sound.set_volume(0.2)
-        pygame.mixer.music.load(sound_main_music)
-        pygame.mixer.music.play(-1)  
+        if not headless:
+            pygame.mixer.music.load(asset_manifest.resolve(sound_main_music))
+            pygame.mixer.music.play(-1)  
 
-        self.background_image = pygame.image.load(join('assets', 'images', 'bg', '1349322.png')).convert_alpha()
-        self.font = pygame.font.Font(FONT_PATH, FONT_SIZE)
+        self.full_redraw = True
+        self.dirty_rects = []
+        self.overlay_rect = None
+        self.pixels_pushed = 0
 
         self.menu = Menu(self.display_surface)
+        self.leaderboard = LeaderboardView(self.display_surface)
 
-        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites = pygame.sprite.LayeredUpdates()
         self.stars = pygame.sprite.Group()
         self.meteors = pygame.sprite.Group()
         self.lasers = pygame.sprite.Group()
-        self.health = Health(self.all_sprites)
-        self.energy = Energy(self.all_sprites)
-        self.player = Player(self.all_sprites, self.lasers, self.health, self.energy)  
-        self.score = Scoreboard(self.all_sprites)
-
-        self.spawn_time_meteors = pygame.time.get_ticks()
-        self.spawn_time_stars = pygame.time.get_ticks()
-        self.initial_spawn_interval = random.randint(1000, 2000)
-        self.spawn_interval_meteors = self.initial_spawn_interval
-        self.spawn_interval_stars = SPAWN_INTERVAL_STARS
-        self.meteors_spawned = 0
-
-        self.high_scores_manager = HighScoresManager()
-
-    def spawn_stars(self):
-        current_time = pygame.time.get_ticks()
-        if current_time - self.spawn_time_stars >= self.spawn_interval_stars and len(self.stars) < MAX_STARS:
-            star = Stars(self.all_sprites)
-            self.all_sprites.add(star)
-            self.stars.add(star)
-            self.spawn_time_stars = current_time
-
-            if self.meteors_spawned % SPAWN_DECREASE_RATE == 0:
-                self.spawn_interval_stars = max(MIN_SPAWN_INTERVAL, self.spawn_interval_stars - 50)
-
-    def spawn_meteors(self):
-        current_time = pygame.time.get_ticks()
-        if current_time - self.spawn_time_meteors >= self.spawn_interval_meteors and len(self.meteors) < MAX_METEORS:
-            meteor = Meteor(self.all_sprites, self.meteors)
-            self.all_sprites.add(meteor)
-            self.meteors.add(meteor)
-            self.spawn_time_meteors = current_time
-            self.meteors_spawned += 10
-
-            if self.meteors_spawned % SPAWN_DECREASE_RATE == 0:
-                self.spawn_interval_meteors = max(MIN_SPAWN_INTERVAL, self.spawn_interval_meteors - 100)
+        self.broadphase = SpatialHash(WINDOW_WIDTH, WINDOW_HEIGHT, COLLISION_CELL_SIZE)
+        self.spawner = SpawnScheduler(waves if waves is not None else load_waves(WAVES_PATH), self.random)
+        self.spawner.add_stream('stars', self.spawn_star, lambda: len(self.stars))
+        self.spawner.add_stream('meteors', self.spawn_meteor, lambda: len(self.meteors))
+        self.player = self.health = self.energy = self.score = None
+        self.round = Round(self)
+        self.simulation = SimulationThread(self.simulation_step, self.take_snapshot, self.logic_dt or FIXED_DT,
+                                           MAX_LOGIC_STEPS)
+        self.render_times = deque(maxlen=600)
+
+        self.high_scores_manager = high_scores if high_scores is not None else HighScoresManager()
+
+        self.backdrop = Background((WINDOW_WIDTH, WINDOW_HEIGHT), BG_COLOR)
+        self.io_worker = io_worker
+        self.io_worker.submit(pygame.image.load, asset_manifest.resolve(BACKGROUND_IMAGE), callback=self.set_background)
+        for sprite_class in (Meteor, Player, Stars, Laser, AnimatedExplosion):
+            sprite_class.prefetch(self.io_worker)
+        self.loading = LoadingStage(self.gameplay_tasks())
+        if headless:
+            self.load_gameplay()
+
+    def gameplay_tasks(self):
+        """
+         Everything PLAYING needs that the menu does not. The images are already being decoded on the
+         I/O worker, so by the time the player picks Play most of these only build frame sets from memory.
+        """
+        return [
+            ('Loading sounds', self.load_sounds),
+            ('Decoding images', self.io_worker.wait),
+            ('Preparing sprites', self.create_stores),
+            ('Launching ship', self.round.enter),
+        ]
+
+    def load_gameplay(self):
+        self.io_worker.drain()
+        self.loading.run()
+
+    def set_background(self, image):
+        """
+         The dirty-rect renderer restores sprites' old spots from self.background, so it gets the starfield
+         frozen in place. A scrolling one would change every pixel of every frame.
+        """
+        self.backdrop.set_image(image)
+        self.background = self.backdrop.static
+
+    def load_sounds(self):
+        audio_manager.register('explosion', sound_explosion, volume=0.2, voices=4, priority=1)
+
+    def create_stores(self):
+        self.meteor_store = Meteor.create_store(max(1, self.spawner.max_limit('meteors')))
+        self.star_store = Stars.create_store(max(1, self.spawner.max_limit('stars')))
+        explosion_effects.load()
+
+    def spawn_star(self):
+        star = Stars(self.all_sprites, self.star_store, self.random)
+        self.all_sprites.add(star)
+        self.stars.add(star)
+        return True
+
+    def spawn_meteor(self):
+        meteor = meteor_pool.acquire(self.all_sprites, self.meteors, self.meteor_store, self.random)
+        if meteor is None:
+            return False
+        self.all_sprites.add(meteor)
+        self.meteors.add(meteor)
+        return True
 
     def handle_collisions(self):
-        player_collisions = pygame.sprite.spritecollide(self.player, self.meteors, False, pygame.sprite.collide_mask)
+        self.broadphase.build(self.meteors)
+
+        player_collisions = self.broadphase.spritecollide(self.player, False, pygame.sprite.collide_mask)
         for meteor in player_collisions:
-            PlayerExplosion(self.player.rect.center, self.all_sprites)
-            self.collision_sound.play()
+            player_explosion_pool.acquire(self.player.rect.center, self.all_sprites, self.game_clock)
+            audio_manager.play('explosion')
             self.health.reduce(10)
 
         for laser in self.lasers:
-            laser_collision = pygame.sprite.spritecollide(laser, self.meteors, True, pygame.sprite.collide_mask)
+            laser_collision = self.broadphase.spritecollide(laser, True, collide_hitbox, laser.hitbox)
             for meteor in laser_collision:
-                self.collision_sound.play()
+                audio_manager.play('explosion')
                 laser.kill()
                 self.score.increase_score()
-                AnimatedExplosion(laser.rect.midtop, self.all_sprites)
+                explosion_pool.acquire(laser.rect.midtop, self.all_sprites, self.game_clock)
 
     def draw_text(self, text, position, color=BUTTON_TEXT_COLOR):
-        text_surface = self.font.render(text, True, color)
+        text_surface = text_renderer.render(text, FONT_SIZE, color)
         text_rect = text_surface.get_rect(center=position)
         self.display_surface.blit(text_surface, text_rect)
 
-    def game_over(self):
+    def draw_game_over(self):
         x = WINDOW_WIDTH // 2
         y = WINDOW_HEIGHT // 2
         input_box = pygame.Rect(x - BUTTON_WIDTH // 2, y - BUTTON_HEIGHT // 2, BUTTON_WIDTH, BUTTON_HEIGHT)
 
-        name = ''
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN and name:  
-                        self.high_scores_manager.add_high_score(name, self.score.current_score)
-                        self.display_high_scores()
-                        self.reset_game()
-                        self.current_state = GameState.MAIN_MENU  
-                        return
-                    elif event.key == pygame.K_BACKSPACE:
-                        name = name[:-1]
-                    else:
-                        name += event.unicode
+        pygame.draw.rect(self.display_surface, DEFAULT_BOX_COLOR, input_box)
+        self.draw_text('New High Score !!! Enter your name: ', (x, y - 50))
+        self.draw_text(self.player_name, input_box.center)
 
-            pygame.draw.rect(self.display_surface, DEFAULT_BOX_COLOR, input_box)
-            self.draw_text('New High Score !!! Enter your name: ', (x, y - 50))
-            self.draw_text(name, input_box.center)
-            pygame.display.flip()
+    def game_over_input(self, event):
+        if event.key == pygame.K_RETURN and self.player_name:
+            self.high_scores_manager.add_high_score(self.player_name, self.score.current_score)
+            self.reset_game()
+            self.change_state(GameState.LEADERBOARD)
+        elif event.key == pygame.K_BACKSPACE:
+            self.player_name = self.player_name[:-1]
+        else:
+            self.player_name += event.unicode
 
     def reset_game(self):
-        self.health.width = self.health.initial_width
-        self.energy.energy_width = self.energy.initial_width
-        self.score.current_score = 0
-        self.spawn_time_meteors = pygame.time.get_ticks()
-        self.spawn_time_stars = pygame.time.get_ticks()
-        self.spawn_interval_meteors = self.initial_spawn_interval
-        self.spawn_interval_stars = SPAWN_INTERVAL_STARS
-        self.meteors_spawned = 0
-        self.all_sprites.empty()
-        self.stars.empty()
-        self.meteors.empty()
-        self.lasers.empty()
-        self.health = Health(self.all_sprites)
-        self.energy = Energy(self.all_sprites)
-        self.player = Player(self.all_sprites, self.lasers, self.health, self.energy)  
-        self.score = Scoreboard(self.all_sprites)
-
-    def display_high_scores(self):
-        high_scores = self.high_scores_manager.get_high_scores()
-        self.display_surface.fill(FAQ_BG_COLOR)
-        y_offset = 100
-
-        for i, score_entry in enumerate(high_scores):
-            self.draw_text(f"{i + 1}. {score_entry['name']}: {score_entry['score']}", (WINDOW_WIDTH // 2, y_offset + i * 50))
-
-        pygame.display.flip()
-
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
-                elif event.type == pygame.KEYDOWN:
-                    return
-
-    def handle_events(self):
-        for event in pygame.event.get():
+        self.round.exit()
+        self.round.enter()
+
+    def draw_loading(self):
+        x = WINDOW_WIDTH // 2
+        y = WINDOW_HEIGHT // 2
+        bar = pygame.Rect(x - BUTTON_WIDTH // 2, y - BUTTON_HEIGHT // 2, BUTTON_WIDTH, BUTTON_HEIGHT)
+
+        self.display_surface.fill(BG_COLOR)
+        fill = bar.inflate(-8, -8)
+        fill.width = int(fill.width * self.loading.progress)
+        pygame.draw.rect(self.display_surface, DEFAULT_BOX_COLOR, bar, 2)
+        pygame.draw.rect(self.display_surface, DEFAULT_BOX_COLOR, fill)
+        self.draw_text(self.loading.label or 'Ready', (x, y - 60))
+
+    def change_state(self, state):
+        if self.current_state == GameState.PLAYING and state != GameState.PLAYING:
+            self.simulation.stop()
+        self.current_state = state
+        self.needs_redraw = True
+        if state == GameState.PLAYING:
+            self.clock.tick()
+            self.logic_time = 0.0
+            self.render_times.clear()
+        elif state == GameState.GAME_OVER:
+            self.player_name = ''
+        elif state == GameState.LEADERBOARD:
+            self.leaderboard.open(self.high_scores_manager)
+
+    def wait_events(self):
+        """
+         Blocks until an event arrives or MENU_IDLE_TIMEOUT ms pass, then returns every pending event.
+        """
+        event = pygame.event.wait(MENU_IDLE_TIMEOUT)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event, *pygame.event.get()]
+
+    def handle_events(self, events):
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
-                if self.current_state == GameState.PLAYING and event.key == pygame.K_ESCAPE:
-                    self.current_state = GameState.MAIN_MENU
-                elif self.current_state == GameState.FAQ and (event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE):
-                    self.current_state = GameState.MAIN_MENU
-
-    def game_run(self):
-        while self.running:
-            self.handle_events()
-
-            if self.current_state == GameState.MAIN_MENU:
-                self.menu.display_menu()
-                pygame.display.flip()
-
-                selected_option = self.menu.handle_input()
-                if selected_option == 'Play':
-                    self.current_state = GameState.PLAYING
-                elif selected_option == 'FAQ':
-                    self.current_state = GameState.FAQ
-                elif selected_option == 'Quit':
-                    self.running = False
-                elif selected_option == 'Leaderboard':
-                    self.current_state = GameState.LEADERBOARD
-
-            elif self.current_state == GameState.PLAYING:
-                dt = self.clock.tick(60) / 1000  
-                self.display_surface.fill(BG_COLOR)
-                self.display_surface.blit(self.background_image, (0, 0))
+                self.handle_key(event)
+
+    def handle_key(self, event):
+        if self.current_state == GameState.PLAYING:
+            if event.key == pygame.K_ESCAPE:
+                self.change_state(GameState.MAIN_MENU)
+            elif event.key == pygame.K_F3:
+                self.profiler.toggle_overlay()
+                self.full_redraw = True
+
+        elif self.current_state == GameState.MAIN_MENU:
+            self.needs_redraw = True
+            selected_option = self.menu.handle_key(event)
+            if selected_option == 'Play':
+                self.change_state(GameState.PLAYING if self.loading.finished else GameState.LOADING)
+            elif selected_option == 'FAQ':
+                self.change_state(GameState.FAQ)
+            elif selected_option == 'Quit':
+                self.running = False
+            elif selected_option == 'Leaderboard':
+                self.change_state(GameState.LEADERBOARD)
+
+        elif self.current_state == GameState.FAQ:
+            if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
+                self.change_state(GameState.MAIN_MENU)
+
+        elif self.current_state == GameState.LEADERBOARD:
+            self.needs_redraw = True
+            if self.leaderboard.handle_key(event) == 'back':
+                self.change_state(GameState.MAIN_MENU)
+
+        elif self.current_state == GameState.GAME_OVER:
+            self.needs_redraw = True
+            self.game_over_input(event)
+
+    def draw_state(self):
+        if self.current_state == GameState.MAIN_MENU:
+            self.menu.display_menu()
+        elif self.current_state == GameState.FAQ:
+            self.menu.display_faq()
+        elif self.current_state == GameState.LEADERBOARD:
+            self.leaderboard.draw()
+        elif self.current_state == GameState.GAME_OVER:
+            self.draw_game_over()
+
+    def draw(self):
+        if self.render_mode == DIRTY_RENDER:
+            self.draw_dirty()
+            return
+
+        with self.profiler.phase('background'):
+            self.backdrop.draw(self.display_surface, self.game_clock.now())
+        with self.profiler.phase('draw'):
+            self.all_sprites.draw(self.display_surface)
+
+    def update_entities(self, dt):
+        for store in (self.meteor_store, self.star_store):
+            for sprite in store.step(dt):
+                sprite.kill()
+            store.sync()
+
+    def step(self, dt):
+        with self.step_profiler.phase('update'):
+            self.all_sprites.update(dt)
+            self.update_entities(dt)
+        with self.step_profiler.phase('spawn'):
+            self.spawner.update(dt)
+        with self.step_profiler.phase('collisions'):
+            self.handle_collisions()
+        audio_manager.flush()
+
+    def draw_dirty(self):
+        """
+         Restores the background under last frame's sprites and profiler overlay and redraws only the sprites,
+         collecting the changed rects for present(). The first frame after a state change is drawn in full.
+        """
+        if self.full_redraw:
+            with self.profiler.phase('background'):
+                self.display_surface.blit(self.background, (0, 0))
+            with self.profiler.phase('draw'):
                 self.all_sprites.draw(self.display_surface)
-                self.all_sprites.update(dt)
-                self.health.increase(5)
-                self.spawn_stars()
-                self.spawn_meteors()
-                self.handle_collisions()
+            self.dirty_rects = [self.display_surface.get_rect()]
+            self.full_redraw = False
+        else:
+            with self.profiler.phase('background'):
+                if self.overlay_rect is not None:
+                    self.display_surface.blit(self.background, self.overlay_rect, self.overlay_rect)
+                self.all_sprites.clear(self.display_surface, self.background)
+            with self.profiler.phase('draw'):
+                self.dirty_rects = self.all_sprites.draw(self.display_surface)
+
+    def present(self):
+        self.overlay_rect = self.profiler.draw_overlay(self.display_surface)
+        with self.profiler.phase('flip'):
+            if self.render_mode == DIRTY_RENDER:
+                if self.overlay_rect is not None:
+                    self.dirty_rects.append(self.overlay_rect)
+                pygame.display.update(self.dirty_rects)
+                self.pixels_pushed = sum(rect.w * rect.h for rect in self.dirty_rects)
+            else:
                 pygame.display.flip()
+                self.pixels_pushed = WINDOW_WIDTH * WINDOW_HEIGHT
+
+    def allocation_count(self):
+        pools = (meteor_pool, laser_pool, explosion_pool, player_explosion_pool)
+        return sum(pool.allocated for pool in pools) + asset_cache.misses
+
+    def entity_counts(self):
+        return {'all_sprites': len(self.all_sprites), 'meteors': len(self.meteors), 'lasers': len(self.lasers),
+                'stars': len(self.stars), 'spawns_held': self.spawner.held()}
+
+    def end_frame(self):
+        if not self.profiler.enabled:
+            return
+        allocations = self.allocation_count()
+        # While the simulation thread runs it owns the groups, so the counts come from its latest snapshot
+        entities = self.simulation.buffer.latest()[1].counts if self.simulation.alive else self.entity_counts()
+        counts = {**entities, 'pixels': self.pixels_pushed, 'io_queue': self.io_worker.queue_depth}
+        self.profiler.end_frame(counts, allocations - self.allocations)
+        self.allocations = allocations
+
+    def export_trace(self):
+        if self.trace_path is not None:
+            self.profiler.export(self.trace_path)
+
+    def close(self):
+        self.simulation.stop()
+        self.export_trace()
+        self.round.exit()
+        self.high_scores_manager.close()
+        self.io_worker.shutdown()
+
+    def simulate(self, frames, dt=FIXED_DT, render=False, realtime=False):
+        """
+         Runs the PLAYING state for up to `frames` fixed steps. Without `realtime` it never waits on the
+         display clock. Stops early when the player dies or quits and returns the number of frames simulated.
+        """
+        if not self.loading.finished:
+            self.load_gameplay()
+        self.current_state = GameState.PLAYING
+        for frame in range(frames):
+            if realtime:
+                self.clock.tick(60)
+                if any(event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE)
+                       for event in pygame.event.get()):
+                    return frame
+
+            self.profiler.begin_frame()
+            self.io_worker.drain()
+            self.game_clock.advance(dt)
+            if render or realtime:
+                self.draw()
+            self.step(dt)
+            if render or realtime:
+                self.present()
+            self.end_frame()
+
+            if self.health.width <= 0:
+                self.current_state = GameState.GAME_OVER
+                return frame + 1
+        return frames
+
+    def logic_steps(self, dt):
+        """
+         Time steps to simulate for a frame that took dt seconds. Without logic_hz that is one step of dt.
+         With it, logic runs in fixed steps of 1 / logic_hz however often frames are drawn,
+         dropping time it cannot catch up on within MAX_LOGIC_STEPS.
+        """
+        if self.logic_dt is None:
+            return [dt]
+        self.logic_time += dt
+        steps = int(self.logic_time / self.logic_dt)
+        self.logic_time -= steps * self.logic_dt
+        return [self.logic_dt] * min(steps, MAX_LOGIC_STEPS)
+
+    def play_frame(self):
+        dt = self.clock.tick(self.fps) / 1000
+        self.render_times.append(perf_counter())
+        if self.fixed_dt is not None:
+            dt = self.fixed_dt
+        self.profiler.begin_frame()
+        start = perf_counter()
+        self.io_worker.drain()
+        self.draw()
+        for step_dt in self.logic_steps(dt):
+            self.game_clock.advance(step_dt)
+            self.step(step_dt)
+            if self.health.width <= 0:
+                break
+        # Timed before present(): a flip blocked on vsync is not work the governor can shed
+        if self.fixed_dt is None:
+            self.spawner.record_frame((perf_counter() - start) * 1000)
+        self.present()
+        self.end_frame()
+
+        if self.health.width <= 0:
+            self.change_state(GameState.GAME_OVER)
+
+    def simulation_step(self, dt):
+        """
+         One step on the simulation thread. The governor gets the step's share of its own dt as the frame load,
+         since drawing happens on the other thread.
+        """
+        start = perf_counter()
+        self.step_profiler.begin_frame()
+        self.game_clock.advance(dt)
+        self.step(dt)
+        self.step_profiler.end_frame()
+        if self.fixed_dt is None:
+            self.spawner.record_frame((perf_counter() - start) / dt * self.spawner.budget_ms)
+        return self.health.width > 0
+
+    def take_snapshot(self):
+        sprites = tuple((id(sprite), sprite.image, sprite.rect.x, sprite.rect.y) for sprite in self.all_sprites)
+        return Snapshot(self.game_clock.now(), perf_counter(), sprites, self.score.current_score,
+                        self.health.width, self.energy.width, self.entity_counts())
+
+    def draw_snapshot(self, previous, current):
+        alpha = (perf_counter() - current.published) / self.simulation.dt
+        time = current.time if previous is None else previous.time + (current.time - previous.time) * min(alpha, 1)
+        with self.profiler.phase('background'):
+            self.backdrop.draw(self.display_surface, time)
+        with self.profiler.phase('draw'):
+            self.display_surface.blits(interpolate(previous, current, alpha, MAX_INTERPOLATION), doreturn=False)
+
+    def play_threaded_frame(self):
+        """
+         Draws the latest snapshots from the simulation thread, which keeps stepping at its own fixed rate
+         while this thread waits on the display. Game state is only touched here once the thread has stopped.
+        """
+        self.clock.tick(self.fps)
+        self.render_times.append(perf_counter())
+        self.profiler.begin_frame()
+        self.io_worker.drain()
+        self.controls.sample()
+        self.simulation.start()
+        self.draw_snapshot(*self.simulation.buffer.latest())
+        self.present()
+        self.end_frame()
+
+        if not self.simulation.running:
+            self.simulation.stop()
+            if self.simulation.error is not None:
+                raise self.simulation.error
+            self.change_state(GameState.GAME_OVER)
+
+    def frame_stats(self):
+        """
+         Interval jitter of recent logic steps and drawn frames, in milliseconds.
+         In threaded mode the percentiles of the simulation thread's step phases are added.
+        """
+        stats = {'simulation': self.simulation.stats(), 'render': interval_stats(self.render_times, 1000 / self.fps)}
+        if self.step_profiler is not self.profiler:
+            stats.update({f'step {name}': values for name, values in self.step_profiler.summary().items()})
+        return stats
 
-                if self.health.width <= 0:
-                    self.current_state = GameState.GAME_OVER
-                    self.game_over()
-
-            elif self.current_state == GameState.FAQ:
-                self.menu.display_faq()
+    def game_run(self):
+        while self.running:
+            if self.current_state == GameState.PLAYING:
+                self.handle_events(pygame.event.get())
+                if self.current_state == GameState.PLAYING:
+                    if self.threaded:
+                        self.play_threaded_frame()
+                    else:
+                        self.play_frame()
+            elif self.current_state == GameState.LOADING:
+                self.handle_events(pygame.event.get())
+                self.io_worker.drain()
+                if self.loading.step(LOADING_BUDGET_MS):
+                    self.change_state(GameState.PLAYING)
+                self.full_redraw = True
+                self.draw_loading()
                 pygame.display.flip()
-
-            elif self.current_state == GameState.LEADERBOARD:
-                self.display_high_scores()
-                self.current_state = GameState.MAIN_MENU  
-
+                self.clock.tick(60)
+            else:
+                self.full_redraw = True
+                if self.needs_redraw:
+                    self.draw_state()
+                    pygame.display.flip()
+                    self.needs_redraw = False
+                self.handle_events(self.wait_events())
+                self.io_worker.drain()
+
+        self.close()
         pygame.quit()
 
 if __name__ == '__main__':
@@ -0,0 +1,79 @@
+import argparse
+import csv
+from time import perf_counter
+
+from engine_support import InputRecorder, KeyboardInput, Replay, state_digest
+from levels.main import Game, FIXED_DT
+from ui import GameState
+
+MAX_RECORDED_FRAMES = 60 * 60 * 60
+
+
+def record(filename, seed, dt=FIXED_DT):
+    recorder = InputRecorder(KeyboardInput())
+    game = Game(controls=recorder, seed=seed, fixed_dt=dt)
+    game.simulate(MAX_RECORDED_FRAMES, dt, realtime=True)
+
+    replay = Replay(seed, dt, recorder.frames, state_digest(game))
+    replay.save(filename)
+    game.close()
+    return replay
+
+
+def play(filename, fast=False, profile=None):
+    """
+     Replays a recorded session, in real time with a window or headless as fast as possible.
+     Returns the replay, the digest of the final state and the per-frame step times in milliseconds.
+    """
+    replay = Replay.load(filename)
+    game = Game(headless=fast, controls=replay.controls(), seed=replay.seed, fixed_dt=replay.dt)
+
+    frame_times = []
+    if fast:
+        for _ in range(len(replay.frames)):
+            start = perf_counter()
+            game.simulate(1, replay.dt)
+            frame_times.append((perf_counter() - start) * 1000)
+            if game.current_state == GameState.GAME_OVER:
+                break
+    else:
+        game.simulate(len(replay.frames), replay.dt, realtime=True)
+
+    digest = state_digest(game)
+    game.close()
+    if profile:
+        with open(profile, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['frame', 'ms'])
+            writer.writerows(enumerate(frame_times))
+
+    return replay, digest, frame_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record and replay Asteroid Fury sessions.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record', help='play with the keyboard and save the session')
+    record_parser.add_argument('filename')
+    record_parser.add_argument('--seed', type=int, default=0)
+
+    play_parser = commands.add_parser('play', help='replay a saved session')
+    play_parser.add_argument('filename')
+    play_parser.add_argument('--fast', action='store_true', help='run headless as fast as possible')
+    play_parser.add_argument('--profile', help='write per-frame step times to this CSV file (with --fast)')
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        replay = record(args.filename, args.seed)
+        print(f'recorded {len(replay.frames)} frames, digest {replay.digest:08x}')
+    else:
+        replay, digest, frame_times = play(args.filename, args.fast, args.profile)
+        status = 'match' if digest == replay.digest else 'MISMATCH'
+        print(f'replayed {len(replay.frames)} frames, digest {digest:08x} ({status})')
+        if frame_times:
+            print(f'mean step {sum(frame_times) / len(frame_times):.3f} ms, max {max(frame_times):.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
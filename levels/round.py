@@ -0,0 +1,40 @@
+from engine_support import Scene
+from game_elements import Player, meteor_pool, laser_pool, explosion_pool, player_explosion_pool, explosion_effects
+from high_score_resources import Scoreboard
+from ui import Health, Energy
+
+POOLS = (meteor_pool, laser_pool, explosion_pool, player_explosion_pool)
+
+
+class Round(Scene):
+    """
+     One game from launch to game over. The player and HUD are built on the first enter() and only reset
+     on later ones. exit() empties the groups and hands every pooled sprite back to its pool.
+    """
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def on_enter(self):
+        game = self.game
+        if game.player is None:
+            game.health = Health(game.all_sprites, game.game_clock)
+            game.energy = Energy(game.all_sprites, game.game_clock)
+            game.player = Player(game.all_sprites, game.lasers, game.health, game.energy, game.controls,
+                                 game.game_clock)
+            game.score = Scoreboard(game.all_sprites)
+        else:
+            for sprite in (game.health, game.energy, game.player, game.score):
+                sprite.reset()
+                game.all_sprites.add(sprite)
+        game.spawner.reset()
+        explosion_effects.reset()
+
+    def on_exit(self):
+        game = self.game
+        for group in (game.all_sprites, game.stars, game.meteors, game.lasers):
+            group.empty()
+        game.meteor_store.clear()
+        game.star_store.clear()
+        for pool in POOLS:
+            pool.reclaim()
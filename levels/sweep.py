@@ -0,0 +1,147 @@
+import argparse
+import csv
+import itertools
+import os
+from multiprocessing import Pool, cpu_count
+from statistics import mean
+from time import perf_counter
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+# SDL turns SIGTERM into a quit event, which would keep workers alive when the pool shuts down.
+os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')
+
+from engine_support import AutoPilot, load_waves
+from high_score_resources import HighScoresManager
+from levels.main import Game, FIXED_DT, WAVES_PATH
+
+
+def set_meteor_wave_setting(name):
+    def apply(game, waves, value):
+        for wave in waves:
+            if name in wave.get('meteors', {}):
+                wave['meteors'][name] = value
+    return apply
+
+
+def set_player_setting(*names):
+    def apply(game, waves, value):
+        if game is not None:
+            for name in names:
+                setattr(game.player, name, value)
+    return apply
+
+
+PARAMETERS = {
+    'decay': set_meteor_wave_setting('decay'),
+    'min_interval': set_meteor_wave_setting('min_interval'),
+    'cooldown': set_player_setting('cooldown', 'cooldown_duration'),
+    'special_cost': set_player_setting('special_cost'),
+    'special_threshold': set_player_setting('special_threshold'),
+}
+
+
+def parse_grid(items):
+    """
+     Turns ['cooldown=200,400', 'min_interval=120,150'] into every combination as a list of dicts.
+    """
+    axes = []
+    for item in items:
+        name, _, values = item.partition('=')
+        if name not in PARAMETERS:
+            raise SystemExit(f"unknown parameter {name!r}, choose from {', '.join(PARAMETERS)}")
+        axes.append([(name, float(value) if '.' in value else int(value)) for value in values.split(',')])
+    return [dict(combination) for combination in itertools.product(*axes)]
+
+
+def run_case(case):
+    """
+     One seeded game with the autopilot. Runs in a worker process.
+    """
+    params, seed, frames, dt = case
+    waves = load_waves(WAVES_PATH)
+    for name, value in params.items():
+        PARAMETERS[name](None, waves, value)
+
+    pilot = AutoPilot()
+    game = Game(headless=True, controls=pilot, seed=seed, fixed_dt=dt, waves=waves,
+                high_scores=HighScoresManager(':memory:', legacy_filename=None))
+    for name, value in params.items():
+        PARAMETERS[name](game, waves, value)
+    pilot.attach(game.player, game.meteors)
+
+    peaks = {'meteors': 0, 'lasers': 0, 'sprites': 0}
+    survived = 0
+    while survived < frames and game.health.width > 0:
+        game.simulate(1, dt)
+        survived += 1
+        peaks['meteors'] = max(peaks['meteors'], len(game.meteors))
+        peaks['lasers'] = max(peaks['lasers'], len(game.lasers))
+        peaks['sprites'] = max(peaks['sprites'], len(game.all_sprites))
+    score = game.score.current_score
+    game.close()
+    return params, seed, {'survival': survived * dt, 'score': score, 'died': game.health.width <= 0, **peaks}
+
+
+def aggregate(results):
+    rows = {}
+    for params, seed, result in results:
+        rows.setdefault(tuple(params.items()), []).append(result)
+
+    table = []
+    for key, runs in rows.items():
+        table.append({
+            **dict(key),
+            'runs': len(runs),
+            'survival': mean(run['survival'] for run in runs),
+            'min_survival': min(run['survival'] for run in runs),
+            'score': mean(run['score'] for run in runs),
+            'deaths': sum(run['died'] for run in runs),
+            'peak_meteors': max(run['meteors'] for run in runs),
+            'peak_lasers': max(run['lasers'] for run in runs),
+            'peak_sprites': max(run['sprites'] for run in runs),
+        })
+    return sorted(table, key=lambda row: (-row['survival'], -row['score']))
+
+
+def print_table(table):
+    columns = list(table[0])
+    widths = [max(len(column), 8) for column in columns]
+    print(' '.join(f'{column:>{width}}' for column, width in zip(columns, widths)))
+    for row in table:
+        print(' '.join(f'{row[column]:>{width}.1f}' if isinstance(row[column], float) else f'{row[column]:>{width}}'
+                       for column, width in zip(columns, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Play seeded headless games with the autopilot across a '
+                                                 'parameter grid on every core and tabulate the results.')
+    parser.add_argument('grid', nargs='*', help=f"name=v1,v2,... with name one of {', '.join(PARAMETERS)}")
+    parser.add_argument('--seeds', type=int, default=4, help='seeded games per grid point')
+    parser.add_argument('--minutes', type=float, default=3, help='game time cap per run')
+    parser.add_argument('--dt', type=float, default=FIXED_DT)
+    parser.add_argument('--workers', type=int, default=cpu_count())
+    parser.add_argument('--csv', help='also write the table to this file')
+    args = parser.parse_args()
+
+    frames = int(args.minutes * 60 / args.dt)
+    cases = [(params, seed, frames, args.dt) for params in parse_grid(args.grid) for seed in range(args.seeds)]
+
+    start = perf_counter()
+    with Pool(args.workers) as pool:
+        results = list(pool.imap_unordered(run_case, cases))
+        pool.close()
+        pool.join()
+    table = aggregate(results)
+    print_table(table)
+    print(f'{len(cases)} runs on {args.workers} workers in {perf_counter() - start:.1f}s')
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=list(table[0]))
+            writer.writeheader()
+            writer.writerows(table)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,21 @@
-from levels.main import Game 
+import argparse
+from levels.main import Game, FULL_RENDER, DIRTY_RENDER, FRAME_RATE
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser(description='Asteroid Fury')
+    parser.add_argument('--profile', action='store_true', help='time every frame; F3 toggles the overlay')
+    parser.add_argument('--trace', help='write the frame trace to this .csv or .json file on exit')
+    parser.add_argument('--dirty', action='store_true', help='redraw and update only the regions that changed')
+    parser.add_argument('--logic-hz', type=float, help='run game logic in fixed steps at this rate, e.g. 30')
+    parser.add_argument('--fps', type=int, default=FRAME_RATE, help='frame rate cap for drawing')
+    parser.add_argument('--threaded', action='store_true',
+                        help='step the game on its own thread and draw interpolated snapshots of it')
+    args = parser.parse_args()
+
+    game = Game(profile=args.profile, trace_path=args.trace, render_mode=DIRTY_RENDER if args.dirty else FULL_RENDER,
+                logic_hz=args.logic_hz, fps=args.fps, threaded=args.threaded)
     game.game_run()
+    if args.profile:
+        for name, stats in game.frame_stats().items():
+            print(name, ' '.join(f'{key}={value:.2f}' if isinstance(value, float) else f'{key}={value}'
+                                 for key, value in stats.items()))
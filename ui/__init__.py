@@ -1,2 +1,3 @@
 from .bar_health_energy import *
 from .menus import *
+from .leaderboard import *
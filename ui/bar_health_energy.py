@@ -1,15 +1,20 @@
 import pygame
+from engine_support import real_clock, LAYER_HUD
 from abc import ABC, abstractmethod
 
 class Bar(pygame.sprite.Sprite,ABC):
-    def __init__(self, groups, initial_width, height, color, cooldown_duration, position):
+    _layer = LAYER_HUD
+
+    def __init__(self, groups, initial_width, height, color, cooldown_duration, position, regen, clock=real_clock):
         super().__init__(groups)  
+        self.clock = clock
 
         self.initial_width = initial_width
         self.width = initial_width
         self.height = height
         self.color = color
         self.cooldown_duration = cooldown_duration
+        self.regen = regen
         self.rect_center = position
         
         self.image = pygame.Surface((self.width, self.height))
@@ -17,7 +22,7 @@ class Bar(pygame.sprite.Sprite,ABC):
         self.rect = self.image.get_rect(center=self.rect_center)
 
         self.can_regenerate = True
-        self.last_update_time = pygame.time.get_ticks()
+        self.regen_timer = self.clock.timer(self.cooldown_duration)
 
     @abstractmethod
     def increase(self, amount):
@@ -27,6 +32,20 @@ class Bar(pygame.sprite.Sprite,ABC):
     def reduce(self, amount):
         pass
 
+    def reset(self):
+        self.width = self.initial_width
+        self.can_regenerate = True
+        self.regen_timer.restart()
+        self.update_image()
+
+    def update(self, dt):
+        """
+         Regenerates `regen` for every cooldown_duration of game time that has passed.
+        """
+        periods = self.regen_timer.due()
+        if periods and self.can_regenerate:
+            self.increase(self.regen * periods)
+
     def update_image(self):
         self.image = pygame.Surface((self.width, self.height))
         self.image.fill(self.color)
@@ -34,16 +53,14 @@ class Bar(pygame.sprite.Sprite,ABC):
 
 
 class Health(Bar):
-    def __init__(self, groups):
-        super().__init__(groups, initial_width=300, height=10, color=(0, 255, 0), cooldown_duration=800, position=(170, 650))
+    def __init__(self, groups, clock=real_clock):
+        super().__init__(groups, initial_width=300, height=10, color=(0, 255, 0), cooldown_duration=800, position=(170, 650), regen=5, clock=clock)
 
     def increase(self, amount):
-        if pygame.time.get_ticks() >= self.last_update_time + self.cooldown_duration:
-            self.width += amount
-            if self.width > self.initial_width:
-                self.width = self.initial_width
-            self.last_update_time = pygame.time.get_ticks()
-            self.update_image()
+        self.width += amount
+        if self.width > self.initial_width:
+            self.width = self.initial_width
+        self.update_image()
 
     def reduce(self, amount):
         self.width -= amount
@@ -53,16 +70,14 @@ class Health(Bar):
 
 
 class Energy(Bar):
-    def __init__(self, groups):
-        super().__init__(groups, initial_width=200, height=10, color=(0, 128, 255), cooldown_duration=100, position=(170, 665))
+    def __init__(self, groups, clock=real_clock):
+        super().__init__(groups, initial_width=200, height=10, color=(0, 128, 255), cooldown_duration=100, position=(170, 665), regen=3.5, clock=clock)
 
     def increase(self, amount):
-        if pygame.time.get_ticks() >= self.last_update_time + self.cooldown_duration:
-            self.width += amount
-            if self.width > self.initial_width:
-                self.width = self.initial_width
-            self.last_update_time = pygame.time.get_ticks()
-            self.update_image()
+        self.width += amount
+        if self.width > self.initial_width:
+            self.width = self.initial_width
+        self.update_image()
 
     def reduce(self, amount):
         self.width -= amount
@@ -0,0 +1,195 @@
+import pygame
+from collections import OrderedDict
+from engine_support import WINDOW_WIDTH, WINDOW_HEIGHT, text_renderer
+
+PAGE_SIZE = 10
+ROW_CACHE = 64
+ROW_TOP = 100
+ROW_HEIGHT = 50
+ROW_WIDTH = 900
+ROW_FONT_SIZE = 40
+INFO_FONT_SIZE = 28
+MAX_FILTER_LENGTH = 20
+BACKGROUND_COLOR = '#adadff'
+SELECTED_COLOR = '#8e7cc3'
+TEXT_COLOR = (255, 255, 255)
+TITLE_COLOR = '#1d4971'
+FILTER_FIELDS = ('name', 'day')
+DAY_CHARACTERS = '0123456789-'
+HINT = 'Up/Down PgUp/PgDn Home/End scroll   Tab name/date   Enter filter   Esc back'
+
+
+class LeaderboardView:
+    """
+     Shows the score table one page at a time. Only the visible page is fetched, with keyset paging so deep pages
+     cost the same as the first, and each row is rendered once into a cached surface. A frame is PAGE_SIZE blits
+     however many scores the store holds.
+     Typing edits the name or date (YYYY-MM-DD) filter, Tab switches between them and Enter applies it.
+    """
+    def __init__(self, screen, page_size=PAGE_SIZE, cache_size=ROW_CACHE):
+        self.screen = screen
+        self.page_size = page_size
+        self.cache_size = cache_size
+        self.scores = None
+        self.rows = []
+        self.first_rank = 1
+        self.selected = 0
+        self.total = 0
+        self.field = FILTER_FIELDS[0]
+        self.typed = {field: '' for field in FILTER_FIELDS}
+        self.applied = {field: None for field in FILTER_FIELDS}
+        self.row_surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def open(self, scores):
+        self.scores = scores
+        self.field = FILTER_FIELDS[0]
+        self.typed = {field: '' for field in FILTER_FIELDS}
+        self.apply_filters()
+
+    def apply_filters(self):
+        self.applied = {field: self.typed[field] or None for field in FILTER_FIELDS}
+        self.total = self.scores.count(**self.applied)
+        self.first_page()
+
+    def fetch(self, **keyset):
+        return self.scores.page(self.page_size, **keyset, **self.applied)
+
+    @staticmethod
+    def key(row):
+        return row['score'], row['id']
+
+    def first_page(self):
+        self.rows = self.fetch()
+        self.first_rank = 1
+        self.selected = 0
+
+    def last_page(self):
+        if self.total == 0:
+            return self.first_page()
+        size = (self.total - 1) % self.page_size + 1
+        self.rows = self.scores.page(size, last=True, **self.applied)
+        self.first_rank = self.total - len(self.rows) + 1
+        self.selected = len(self.rows) - 1
+
+    def next_page(self):
+        if not self.rows:
+            return False
+        rows = self.fetch(after=self.key(self.rows[-1]))
+        if not rows:
+            return False
+        self.first_rank += len(self.rows)
+        self.rows = rows
+        self.selected = min(self.selected, len(rows) - 1)
+        return True
+
+    def previous_page(self):
+        if not self.rows or self.first_rank == 1:
+            return False
+        rows = self.fetch(before=self.key(self.rows[0]))
+        if len(rows) < self.page_size:
+            # Scores added since the view opened, or a short first page: realign on the top
+            self.first_page()
+            return True
+        self.first_rank -= len(rows)
+        self.rows = rows
+        return True
+
+    def scroll(self, step):
+        if 0 <= self.selected + step < len(self.rows):
+            self.selected += step
+        elif step > 0 and self.next_page():
+            self.selected = 0
+        elif step < 0 and self.previous_page():
+            self.selected = len(self.rows) - 1
+
+    def edit_filter(self, event):
+        text = self.typed[self.field]
+        if event.key == pygame.K_BACKSPACE:
+            self.typed[self.field] = text[:-1]
+        elif event.unicode and event.unicode.isprintable() and len(text) < MAX_FILTER_LENGTH:
+            if self.field != 'day' or event.unicode in DAY_CHARACTERS:
+                self.typed[self.field] = text + event.unicode
+
+    def handle_key(self, event):
+        """
+         Returns 'back' when the player leaves the leaderboard. Escape clears an active filter first.
+        """
+        if event.key == pygame.K_ESCAPE:
+            if any(self.typed.values()) or any(self.applied.values()):
+                self.open(self.scores)
+                return None
+            return 'back'
+        if event.key == pygame.K_UP:
+            self.scroll(-1)
+        elif event.key == pygame.K_DOWN:
+            self.scroll(1)
+        elif event.key == pygame.K_PAGEUP:
+            self.previous_page()
+        elif event.key == pygame.K_PAGEDOWN:
+            self.next_page()
+        elif event.key == pygame.K_HOME:
+            self.first_page()
+        elif event.key == pygame.K_END:
+            self.last_page()
+        elif event.key == pygame.K_TAB:
+            self.field = FILTER_FIELDS[(FILTER_FIELDS.index(self.field) + 1) % len(FILTER_FIELDS)]
+        elif event.key == pygame.K_RETURN:
+            self.apply_filters()
+        else:
+            self.edit_filter(event)
+        return None
+
+    def render_row(self, rank, row, selected):
+        key = (rank, row['name'], row['score'], row['day'], selected)
+        surface = self.row_surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.row_surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        font = text_renderer.font(ROW_FONT_SIZE)
+        surface = pygame.Surface((ROW_WIDTH, ROW_HEIGHT - 4))
+        surface.fill(SELECTED_COLOR if selected else BACKGROUND_COLOR)
+        middle = surface.get_height() // 2
+        columns = (
+            (f'{rank}.', 'midright', 90),
+            (row['name'], 'midleft', 120),
+            (str(row['score']), 'midright', 620),
+            (row['day'], 'midleft', 680),
+        )
+        for text, anchor, x in columns:
+            text_surface = font.render(text, True, TEXT_COLOR)
+            surface.blit(text_surface, text_surface.get_rect(**{anchor: (x, middle)}))
+
+        self.row_surfaces[key] = surface
+        if len(self.row_surfaces) > self.cache_size:
+            self.row_surfaces.popitem(last=False)
+        return surface
+
+    def blit_text(self, text, size, color, center):
+        surface = text_renderer.render(text, size, color)
+        self.screen.blit(surface, surface.get_rect(center=center))
+
+    def draw(self):
+        self.screen.fill(BACKGROUND_COLOR)
+        self.blit_text('Leaderboard', 60, TITLE_COLOR, (WINDOW_WIDTH / 2, 50))
+
+        left = (WINDOW_WIDTH - ROW_WIDTH) // 2
+        for index, row in enumerate(self.rows):
+            surface = self.render_row(self.first_rank + index, row, index == self.selected)
+            self.screen.blit(surface, (left, ROW_TOP + index * ROW_HEIGHT))
+        if not self.rows:
+            self.blit_text('No scores', ROW_FONT_SIZE, TEXT_COLOR, (WINDOW_WIDTH / 2, ROW_TOP + ROW_HEIGHT))
+
+        fields = '   '.join(f"{'>' if field == self.field else ' '} {field}: {self.typed[field]}"
+                            for field in FILTER_FIELDS)
+        last_rank = self.first_rank + len(self.rows) - 1
+        shown = f'{self.first_rank}-{last_rank} of {self.total}' if self.rows else f'0 of {self.total}'
+        self.blit_text(f'{fields}      {shown}', INFO_FONT_SIZE, TITLE_COLOR, (WINDOW_WIDTH / 2, WINDOW_HEIGHT - 80))
+        self.blit_text(HINT, INFO_FONT_SIZE, TITLE_COLOR, (WINDOW_WIDTH / 2, WINDOW_HEIGHT - 40))
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.row_surfaces)}